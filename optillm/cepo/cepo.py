@@ -1,3 +1,4 @@
+import os
 import re
 import logging
 import yaml
@@ -10,6 +11,7 @@ from optillm import conversation_logger
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Any, Optional
 from cerebras.cloud.sdk import BadRequestError as CerebrasBadRequestError
 from openai import BadRequestError as OpenAIBadRequestError
@@ -17,6 +19,13 @@ from openai import InternalServerError as OpenAIInternalServerError
 
 logger = logging.getLogger(__name__)
 
+# The libyaml-backed loader parses ~5x faster than the pure-Python one;
+# fall back when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 @dataclass
 class CepoConfig:
     bestofn_n: int  # number of responses to be generated in best of n stage
@@ -120,6 +129,14 @@ MCQ_PATTERNS = [
 
 
 # given command line arguments which includes a yaml file path, initialize a CePO configuration
+@lru_cache(maxsize=8)
+def _parse_cepo_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size are part of the cache key so an edited config file
+    # is re-parsed while repeated calls on an unchanged file are O(1)
+    with open(path, "r") as yaml_file:
+        return yaml.load(yaml_file, Loader=_YamlLoader)
+
+
 def init_cepo_config(cmd_line_args: dict) -> CepoConfig:
     # get the command line arguments
     cepo_args = {
@@ -131,8 +148,9 @@ def init_cepo_config(cmd_line_args: dict) -> CepoConfig:
     # get the yaml file arguments
     cepo_config_yaml = {}
     if cmd_line_args.get("cepo_config_file", None):
-        with open(cmd_line_args["cepo_config_file"], "r") as yaml_file:
-            cepo_config_yaml = yaml.safe_load(yaml_file)
+        config_file = cmd_line_args["cepo_config_file"]
+        stat = os.stat(config_file)
+        cepo_config_yaml = _parse_cepo_yaml(config_file, stat.st_mtime_ns, stat.st_size)
 
     # merge cepo args from command line and yaml file, args from command line will overwrite the ones from yaml file
     cepo_args = {**cepo_config_yaml, **cepo_args}
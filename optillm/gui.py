@@ -0,0 +1,98 @@
+"""Gradio chat interface for the optillm proxy.
+
+This module is imported lazily by main() only when --launch-gui is set, so
+the gradio dependency graph (fastapi, uvicorn, pandas, ...) is never paid
+on normal server startups.
+"""
+
+import logging
+import os
+import threading
+
+import gradio as gr
+import httpx
+from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+def _start_proxy(app, host: str, port: int):
+    """Start the proxy in a background thread, bound before returning.
+
+    The listening socket is created synchronously here so Gradio's first
+    request can never race the bind and hit a connection refused; only the
+    accept loop runs in the daemon thread.
+    """
+    threads = max(16, (os.cpu_count() or 1) * 4)
+    try:
+        from waitress import create_server
+        server = create_server(app, host=host, port=port, threads=threads, channel_timeout=1800)
+        target = server.run
+    except ImportError:
+        from werkzeug.serving import make_server
+        server = make_server(host, port, app, threaded=True)
+        target = server.serve_forever
+
+    server_thread = threading.Thread(target=target, daemon=True, name="optillm-proxy")
+    server_thread.start()
+
+def launch(app, host: str, port: int, model: str):
+    """Start the proxy in a background thread and launch the Gradio UI."""
+    _start_proxy(app, host, port)
+
+    # Configure the base URL for the Gradio interface
+    base_url = f"http://localhost:{port}/v1"
+    logger.info(f"Launching Gradio interface connected to {base_url}")
+
+    # One client for the whole session: rebuilding it per turn paid a TCP
+    # connect (plus TLS for remote proxies) on every message, while a shared
+    # keep-alive pool reuses the connection across turns
+    custom_client = OpenAI(
+        api_key="optillm",
+        base_url=base_url,
+        timeout=httpx.Timeout(1800.0, connect=5.0),  # 30 min timeout
+        max_retries=0,  # No retries - prevents duplicate requests
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+    )
+
+    # Create custom chat function with extended timeout. The messages list
+    # lives in per-session gr.State and grows by one pair per turn instead
+    # of being rebuilt from the whole history on every message.
+    def chat_with_optillm(message, history, messages):
+        # Retry, Undo, and Clear rewrite the visible history without
+        # touching this session state, so rebuild the request messages
+        # whenever the two disagree; the plain-send path keeps the
+        # append-only fast path.
+        if len(messages) != 2 * len(history):
+            messages[:] = [
+                {"role": role, "content": text}
+                for user_text, assistant_text in history
+                for role, text in (("user", user_text), ("assistant", assistant_text))
+                if text
+            ]
+        messages.append({"role": "user", "content": message})
+
+        # Make request
+        try:
+            response = custom_client.chat.completions.create(
+                model=model,
+                messages=messages
+            )
+            reply = response.choices[0].message.content
+        except Exception as e:
+            reply = f"Error: {str(e)}"
+        # Record the reply (including errors, which are shown in the chat
+        # history) so the next turn sees the same conversation the user does
+        messages.append({"role": "assistant", "content": reply})
+        return reply
+
+    # Create Gradio interface with queue for long operations
+    demo = gr.ChatInterface(
+        chat_with_optillm,
+        additional_inputs=[gr.State([])],
+        title="OptILLM Chat Interface",
+        description=f"Connected to OptILLM proxy at {base_url}"
+    )
+    demo.queue()  # Enable queue to handle long operations properly
+    demo.launch(server_name=host, share=False)
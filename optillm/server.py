@@ -1,6 +1,8 @@
 import argparse
 import logging
 import os
+import sys
+import types
 import secrets
 import time
 import traceback
@@ -11,13 +13,20 @@ from openai import AzureOpenAI, OpenAI
 from flask import Response
 import json
 import importlib
-import glob
+
+# orjson serializes ~3-5x faster than stdlib json and emits bytes directly;
+# fall back to stdlib json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import asyncio
 import re
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Tuple, Optional, Union, Dict, Any, List
+from functools import lru_cache
+from typing import Tuple, Optional, Union, Dict, Any, List, NamedTuple
 from importlib.metadata import version
-from dataclasses import fields
 
 # Import approach modules
 from optillm.mcts import chat_with_mcts
@@ -32,7 +41,6 @@ from optillm.cot_reflection import cot_reflection
 from optillm.plansearch import plansearch
 from optillm.leap import leap
 from optillm.reread import re2_approach
-from optillm.cepo.cepo import cepo, CepoConfig, init_cepo_config
 from optillm.mars import multi_agent_reasoning_system
 from optillm.batching import RequestBatcher, BatchingError
 from optillm.conversation_logger import ConversationLogger
@@ -41,25 +49,93 @@ import optillm.conversation_logger
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
-logging_levels = {
+# Read-only view: the level map is consulted, never mutated
+logging_levels = types.MappingProxyType({
     "notset": logging.NOTSET,
     "debug": logging.DEBUG,
     "info": logging.INFO,
     "warning": logging.WARNING,
     "error": logging.ERROR,
     "critical": logging.CRITICAL,
-}
+})
 
 # Initialize Flask app
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        """Route Flask's jsonify/get_json through orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=str).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
 # Global request batcher (initialized in main() if batch mode enabled)
 request_batcher = None
 
 # Global conversation logger (initialized in main() if logging enabled)
 conversation_logger = None
 
+# Shared event loop for async execution paths. Creating and tearing down an
+# event loop per request is expensive, so a single loop runs in a daemon
+# thread and coroutines are submitted to it from the Flask worker threads.
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+def get_shared_event_loop():
+    """Return the process-wide event loop, starting its thread on first use."""
+    global _shared_loop
+    if _shared_loop is None:
+        with _shared_loop_lock:
+            if _shared_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, daemon=True, name="optillm-async-loop")
+                thread.start()
+                _shared_loop = loop
+    return _shared_loop
+
+# Cache of (client, api_key) tuples keyed on the configuration fingerprint.
+# Client construction opens an httpx connection pool (and for Azure may run
+# credential discovery), so it should happen once per configuration rather
+# than once per request.
+_client_cache = {}
+
+def _config_fingerprint():
+    return (
+        server_config.get('base_url', ''),
+        server_config.get('ssl_verify', True),
+        server_config.get('ssl_cert_path', ''),
+        os.environ.get("OPTILLM_API_KEY"),
+        os.environ.get("CEREBRAS_API_KEY"),
+        os.environ.get("OPENAI_API_KEY"),
+        os.environ.get("AZURE_OPENAI_API_KEY"),
+        os.environ.get("AZURE_API_VERSION"),
+        os.environ.get("AZURE_API_BASE"),
+    )
+
+@lru_cache(maxsize=128)
+def _client_for_token(api_key: str, base_url: str):
+    """Cache per-bearer-token clients so repeat callers reuse one connection pool."""
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url)
+    return OpenAI(api_key=api_key)
+
 def get_config():
+    fingerprint = _config_fingerprint()
+    cached = _client_cache.get(fingerprint)
+    if cached is not None:
+        return cached
+    client_and_key = _build_default_client()
+    _client_cache[fingerprint] = client_and_key
+    return client_and_key
+
+def _build_default_client():
     import httpx
 
     API_KEY = None
@@ -197,32 +273,53 @@ server_config = {
     'ssl_cert_path': '',
 }
 
-# List of known approaches
-known_approaches = ["none", "mcts", "bon", "moa", "rto", "z3", "self_consistency",
-                   "pvg", "rstar", "cot_reflection", "plansearch", "leap", "re2", "cepo", "mars"]
+# Set of known approaches; frozenset makes the per-token membership tests in
+# parse_combined_approach O(1)
+known_approaches = frozenset(["none", "mcts", "bon", "moa", "rto", "z3", "self_consistency",
+                              "pvg", "rstar", "cot_reflection", "plansearch", "leap", "re2", "cepo", "mars"])
 
 plugin_approaches = {}
 
+# Precompiled patterns for the per-request message scanning helpers
+_APPROACH_TAG_RE = re.compile(r'<optillm_approach>(.*?)</optillm_approach>')
+_CONVERSATION_TAG_RE = re.compile(r'(?=(User:|Assistant:))')
+
+def _flatten_content(content):
+    """Return message content with list-format parts joined into one string.
+
+    String content (the common case) is returned as is. Other non-list
+    content — e.g. the null content of assistant tool-call turns — becomes
+    the empty string rather than being iterated.
+    """
+    if not isinstance(content, list):
+        return content or ''
+    return ' '.join(
+        item.get('text', '') for item in content
+        if isinstance(item, dict) and item.get('type') == 'text'
+    )
+
 def normalize_message_content(messages):
     """
     Ensure all message content fields are strings, not lists.
     Some models don't handle list-format content correctly.
     """
+    # Fast path: OpenAI-format chats usually carry string content only, in
+    # which case the original list can be returned without any allocation
+    if not any(isinstance(message.get('content'), list) for message in messages):
+        return messages
+
     normalized_messages = []
     for message in messages:
-        normalized_message = message.copy()
         content = message.get('content', '')
 
-        # Convert list content to string if needed
+        # Convert list content to string if needed; messages whose content is
+        # already a string are reused without copying
         if isinstance(content, list):
-            # Extract text content from the list
-            text_content = ' '.join(
-                item.get('text', '') for item in content
-                if isinstance(item, dict) and item.get('type') == 'text'
-            )
-            normalized_message['content'] = text_content
-
-        normalized_messages.append(normalized_message)
+            normalized_message = message.copy()
+            normalized_message['content'] = _flatten_content(content)
+            normalized_messages.append(normalized_message)
+        else:
+            normalized_messages.append(message)
 
     return normalized_messages
 
@@ -268,6 +365,12 @@ def none_approach(
             **kwargs
         )
 
+        # For streaming requests, hand the provider iterator straight back so
+        # the proxy can forward chunks as they arrive instead of buffering
+        # the whole completion.
+        if kwargs.get('stream'):
+            return response
+
         # Convert to dict if it's not already
         response_dict = response.model_dump() if hasattr(response, 'model_dump') else response
 
@@ -284,10 +387,42 @@ def none_approach(
         logger.error(f"Error in none approach: {str(e)}")
         raise
 
-def load_plugins():
-   # Clear existing plugins first but modify the global dict in place
-   plugin_approaches.clear()
+def _make_plugin_entry(run_func):
+    """Precompute the reflection needed to dispatch a plugin call.
 
+    Returns a (func, is_async, accepts_request_config) tuple so the request
+    path does not pay for inspect.signature on every call.
+    """
+    import inspect
+    accepts_request_config = 'request_config' in inspect.signature(run_func).parameters
+    return (run_func, inspect.iscoroutinefunction(run_func), accepts_request_config)
+
+# Cache of loaded plugin modules keyed by file path, storing (mtime, module).
+# Re-running load_plugins only re-executes a plugin whose file has changed
+# on disk instead of paying disk I/O and bytecode compile for every plugin.
+_plugin_module_cache = {}
+
+def _load_plugin_module(plugin_file):
+    module_name = os.path.basename(plugin_file)[:-3]  # Remove .py extension
+    mtime = os.stat(plugin_file).st_mtime
+    cached = _plugin_module_cache.get(plugin_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _plugin_module_cache[plugin_file] = (mtime, module)
+    return module
+
+# Matches the module-level SLUG assignment every plugin declares, so
+# discovery can learn a plugin's approach name without importing it.
+_SLUG_RE = re.compile(r'^SLUG\s*=\s*[\'"]([^\'"]+)[\'"]', re.MULTILINE)
+
+# Maps discovered plugin slugs to their file paths for lazy loading.
+_plugin_files = {}
+
+def _plugin_dirs():
    # Get installed package plugins directory
    import optillm
    package_plugin_dir = os.path.join(os.path.dirname(optillm.__file__), 'plugins')
@@ -305,48 +440,129 @@ def load_plugins():
    if local_plugin_dir != package_plugin_dir:
        plugin_dirs.append((local_plugin_dir, "local"))
 
-   for plugin_dir, source in plugin_dirs:
+   return plugin_dirs
+
+def _scan_plugin_files(plugin_dir):
+   # os.scandir returns DirEntry objects with cached stat info, avoiding
+   # the extra stat per file that glob-style listing incurs
+   with os.scandir(plugin_dir) as entries:
+       return sorted(entry.path for entry in entries
+                     if entry.is_file() and entry.name.endswith('.py'))
+
+def discover_plugins():
+   """Register plugin slugs without importing the plugin modules.
+
+   Scans the plugin directories and reads each file's SLUG assignment
+   textually, storing a placeholder in plugin_approaches. The module is
+   only imported (via _load_plugin) the first time its approach is
+   actually invoked, so startups that never touch a plugin skip all the
+   plugin imports.
+   """
+   plugin_approaches.clear()
+   _plugin_files.clear()
+
+   for plugin_dir, source in _plugin_dirs():
        logger.info(f"Looking for {source} plugins in: {plugin_dir}")
 
        if not os.path.exists(plugin_dir):
            logger.debug(f"{source.capitalize()} plugin directory not found: {plugin_dir}")
            continue
 
-       plugin_files = glob.glob(os.path.join(plugin_dir, '*.py'))
+       plugin_files = _scan_plugin_files(plugin_dir)
+       if not plugin_files:
+           logger.debug(f"No plugin files found in {source} directory: {plugin_dir}")
+           continue
+
+       for plugin_file in plugin_files:
+           try:
+               with open(plugin_file, 'r') as f:
+                   match = _SLUG_RE.search(f.read())
+               if match is None:
+                   logger.warning(f"Plugin {os.path.basename(plugin_file)} from {source} has no module-level SLUG; skipping")
+                   continue
+               slug = match.group(1)
+               if slug in _plugin_files:
+                   logger.info(f"Overriding {source} plugin: {slug}")
+               _plugin_files[slug] = plugin_file
+               # Placeholder entry; replaced with the real dispatch tuple on
+               # first use
+               plugin_approaches[slug] = None
+               logger.debug(f"Discovered {source} plugin: {slug}")
+           except OSError as e:
+               logger.error(f"Error scanning {source} plugin {plugin_file}: {str(e)}")
+
+   if not plugin_approaches:
+       logger.warning("No plugins discovered from any location")
+
+def _load_plugin(slug):
+   """Import a discovered plugin on first use and cache its dispatch entry."""
+   plugin_file = _plugin_files[slug]
+   module = _load_plugin_module(plugin_file)
+   if not (hasattr(module, 'SLUG') and hasattr(module, 'run')):
+       raise ValueError(f"Plugin {os.path.basename(plugin_file)} missing required attributes (SLUG and run)")
+   entry = _make_plugin_entry(module.run)
+   plugin_approaches[slug] = entry
+   logger.info(f"Loaded plugin: {slug}")
+   return entry
+
+def load_plugins():
+   # Clear existing plugins first but modify the global dict in place
+   plugin_approaches.clear()
+
+   for plugin_dir, source in _plugin_dirs():
+       logger.info(f"Looking for {source} plugins in: {plugin_dir}")
+
+       if not os.path.exists(plugin_dir):
+           logger.debug(f"{source.capitalize()} plugin directory not found: {plugin_dir}")
+           continue
+
+       plugin_files = _scan_plugin_files(plugin_dir)
        if not plugin_files:
            logger.debug(f"No plugin files found in {source} directory: {plugin_dir}")
            continue
 
        logger.info(f"Found {source} plugin files: {plugin_files}")
 
-       for plugin_file in plugin_files:
+       # Import in parallel -- module import releases the GIL during file
+       # I/O -- then register sequentially so overrides stay deterministic
+       def _import_one(plugin_file):
            try:
-               module_name = os.path.basename(plugin_file)[:-3]  # Remove .py extension
-               spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-               module = importlib.util.module_from_spec(spec)
-               spec.loader.exec_module(module)
-
-               if hasattr(module, 'SLUG') and hasattr(module, 'run'):
-                   if module.SLUG in plugin_approaches:
-                       logger.info(f"Overriding {source} plugin: {module.SLUG}")
-                   plugin_approaches[module.SLUG] = module.run
-                   logger.info(f"Loaded {source} plugin: {module.SLUG}")
-               else:
-                   logger.warning(f"Plugin {module_name} from {source} missing required attributes (SLUG and run)")
+               return _load_plugin_module(plugin_file), None
            except Exception as e:
-               logger.error(f"Error loading {source} plugin {plugin_file}: {str(e)}")
+               return None, e
+
+       with ThreadPoolExecutor(max_workers=min(8, len(plugin_files))) as executor:
+           results = list(executor.map(_import_one, plugin_files))
+
+       for plugin_file, (module, error) in zip(plugin_files, results):
+           module_name = os.path.basename(plugin_file)[:-3]  # Remove .py extension
+           if error is not None:
+               logger.error(f"Error loading {source} plugin {plugin_file}: {str(error)}")
+           elif hasattr(module, 'SLUG') and hasattr(module, 'run'):
+               if module.SLUG in plugin_approaches:
+                   logger.info(f"Overriding {source} plugin: {module.SLUG}")
+               plugin_approaches[module.SLUG] = _make_plugin_entry(module.run)
+               logger.info(f"Loaded {source} plugin: {module.SLUG}")
+           else:
+               logger.warning(f"Plugin {module_name} from {source} missing required attributes (SLUG and run)")
 
    if not plugin_approaches:
        logger.warning("No plugins loaded from any location")
 
 def get_config_path():
+    # The result only depends on config_dir, so the stat() behind the lookup
+    # happens once per directory rather than on every call
+    return _resolve_config_path(server_config.get("config_dir", ""))
+
+@lru_cache(maxsize=4)
+def _resolve_config_path(config_dir: str):
     # Get installed package config directory
     import optillm
     package_config_dir = os.path.join(os.path.dirname(optillm.__file__), 'cepo', 'configs')
     package_config_path = os.path.join(package_config_dir, 'cepo_config.yaml')
 
     # Get local project config directory
-    current_dir = os.getcwd() if server_config.get("config_dir", "") == "" else server_config["config_dir"]
+    current_dir = os.getcwd() if config_dir == "" else config_dir
     local_config_dir = os.path.join(current_dir, 'optillm', 'cepo', 'configs')
     local_config_path = os.path.join(local_config_dir, 'cepo_config.yaml')
 
@@ -364,6 +580,14 @@ def parse_combined_approach(model: str, known_approaches: list, plugin_approache
         return 'SINGLE', ['none'], model
 
     parts = model.split('-')
+
+    # Fast path: plain model names like 'gpt-4o-mini' carry no approach
+    # prefix, so skip the token walk entirely
+    first = parts[0]
+    if (first not in known_approaches and first not in plugin_approaches
+            and '&' not in first and '|' not in first):
+        return 'SINGLE', ['none'], model
+
     approaches = []
     operation = 'SINGLE'
     model_parts = []
@@ -393,88 +617,114 @@ def parse_combined_approach(model: str, known_approaches: list, plugin_approache
 
     return operation, approaches, actual_model
 
+# Dispatch table for the built-in approaches, built once at import time so
+# execute_single_approach does an O(1) dict lookup instead of walking an
+# if/elif chain. server_config is read inside each entry so runtime
+# configuration changes are still picked up; 'none' and plugin approaches
+# stay special-cased in execute_single_approach.
+APPROACH_DISPATCH = {
+    # MCTS knobs may be overridden per request; resolve them from
+    # request_config here instead of writing them into the shared
+    # server_config, which would race between concurrent requests
+    'mcts': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        chat_with_mcts(system_prompt, initial_query, client, model,
+                       (request_config or {}).get('mcts_simulations', server_config['mcts_simulations']),
+                       (request_config or {}).get('mcts_exploration', server_config['mcts_exploration']),
+                       (request_config or {}).get('mcts_depth', server_config['mcts_depth']),
+                       request_config, request_id),
+    'bon': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        best_of_n_sampling(system_prompt, initial_query, client, model, server_config['best_of_n'], request_config, request_id),
+    'moa': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        mixture_of_agents(system_prompt, initial_query, client, model, request_config, request_id),
+    'rto': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        round_trip_optimization(system_prompt, initial_query, client, model, request_config, request_id),
+    'z3': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        Z3SymPySolverSystem(system_prompt, client, model, request_config=request_config, request_id=request_id).process_query(initial_query),
+    'self_consistency': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        advanced_self_consistency_approach(system_prompt, initial_query, client, model, request_config, request_id),
+    'pvg': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        inference_time_pv_game(system_prompt, initial_query, client, model, request_config=request_config, request_id=request_id),
+    'rstar': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        RStar(system_prompt, client, model,
+              max_depth=server_config['rstar_max_depth'], num_rollouts=server_config['rstar_num_rollouts'],
+              c=server_config['rstar_c'], request_config=request_config, request_id=request_id).solve(initial_query),
+    'cot_reflection': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        cot_reflection(system_prompt, initial_query, client, model, return_full_response=server_config['return_full_response'], request_config=request_config, request_id=request_id),
+    'plansearch': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        plansearch(system_prompt, initial_query, client, model, n=server_config['n'], request_config=request_config, request_id=request_id),
+    'leap': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        leap(system_prompt, initial_query, client, model, request_config, request_id),
+    're2': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        re2_approach(system_prompt, initial_query, client, model, n=server_config['n'], request_config=request_config, request_id=request_id),
+    'cepo': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        _run_cepo(system_prompt, initial_query, client, model, request_id),
+    'mars': lambda system_prompt, initial_query, client, model, request_config, request_id:
+        multi_agent_reasoning_system(system_prompt, initial_query, client, model, request_config=request_config, request_id=request_id),
+}
+
+@lru_cache(maxsize=1)
+def get_cepo_config():
+    """Build the CepoConfig on first use and reuse it afterwards.
+
+    Covers requests that select CePO per request via the model prefix even
+    when the server was started with a different --approach.
+    """
+    from optillm.cepo.cepo import init_cepo_config
+    return init_cepo_config(server_config)
+
+def _run_cepo(system_prompt, initial_query, client, model, request_id):
+    # The cepo subpackage pulls in yaml and math_verify; import it on first
+    # use so non-CePO startups skip that chain
+    from optillm.cepo.cepo import cepo
+    return cepo(system_prompt, initial_query, client, model, get_cepo_config(), request_id)
+
 def execute_single_approach(approach, system_prompt, initial_query, client, model, request_config: dict = None, request_id: str = None):
-    if approach in known_approaches:
-        if approach == 'none':
-            # Use the request_config that was already prepared and passed to this function
-            kwargs = request_config.copy() if request_config else {}
-
-            # Remove items that are handled separately by the framework
-            # Note: 'n' is NOT removed - the none_approach passes it to the client which handles multiple completions
-            kwargs.pop('stream', None)  # stream is handled by proxy()
-
-            # Reconstruct original messages from system_prompt and initial_query
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            if initial_query:
-                messages.append({"role": "user", "content": initial_query})
-
-            logger.debug(f"none_approach kwargs: {kwargs}")
-            response = none_approach(original_messages=messages, client=client, model=model, request_id=request_id, **kwargs)
-            # For none approach, we return the response and a token count of 0
-            # since the full token count is already in the response
-            return response, 0
-        elif approach == 'mcts':
-            return chat_with_mcts(system_prompt, initial_query, client, model, server_config['mcts_simulations'],
-                                            server_config['mcts_exploration'], server_config['mcts_depth'], request_config, request_id)
-        elif approach == 'bon':
-            return  best_of_n_sampling(system_prompt, initial_query, client, model, server_config['best_of_n'], request_config, request_id)
-        elif approach == 'moa':
-            return mixture_of_agents(system_prompt, initial_query, client, model, request_config, request_id)
-        elif approach == 'rto':
-            return round_trip_optimization(system_prompt, initial_query, client, model, request_config, request_id)
-        elif approach == 'z3':
-            z3_solver = Z3SymPySolverSystem(system_prompt, client, model, request_config=request_config, request_id=request_id)
-            return z3_solver.process_query(initial_query)
-        elif approach == "self_consistency":
-            return advanced_self_consistency_approach(system_prompt, initial_query, client, model, request_config, request_id)
-        elif approach == "pvg":
-            return inference_time_pv_game(system_prompt, initial_query, client, model, request_config=request_config, request_id=request_id)
-        elif approach == "rstar":
-            rstar = RStar(system_prompt, client, model,
-                          max_depth=server_config['rstar_max_depth'], num_rollouts=server_config['rstar_num_rollouts'],
-                          c=server_config['rstar_c'], request_config=request_config, request_id=request_id)
-            return rstar.solve(initial_query)
-        elif approach == "cot_reflection":
-            return cot_reflection(system_prompt, initial_query, client, model, return_full_response=server_config['return_full_response'], request_config=request_config, request_id=request_id)
-        elif approach == 'plansearch':
-            return plansearch(system_prompt, initial_query, client, model, n=server_config['n'], request_config=request_config, request_id=request_id)
-        elif approach == 'leap':
-            return leap(system_prompt, initial_query, client, model, request_config, request_id)
-        elif approach == 're2':
-            return re2_approach(system_prompt, initial_query, client, model, n=server_config['n'], request_config=request_config, request_id=request_id)
-        elif approach == 'cepo':
-            return cepo(system_prompt, initial_query, client, model, cepo_config, request_id)
-        elif approach == 'mars':
-            return multi_agent_reasoning_system(system_prompt, initial_query, client, model, request_config=request_config, request_id=request_id)
-    elif approach in plugin_approaches:
-        # Check if the plugin accepts request_config
-        plugin_func = plugin_approaches[approach]
-        import inspect
-        sig = inspect.signature(plugin_func)
-
-        # Check if the plugin function is async
-        is_async = inspect.iscoroutinefunction(plugin_func)
+    if approach == 'none':
+        # Use the request_config that was already prepared and passed to this function
+        kwargs = request_config.copy() if request_config else {}
+
+        # Note: 'n' and 'stream' are NOT removed - the none_approach passes
+        # them to the client, which handles multiple completions and
+        # streams deltas back natively
+
+        # Reconstruct original messages from system_prompt and initial_query
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        if initial_query:
+            messages.append({"role": "user", "content": initial_query})
+
+        logger.debug(f"none_approach kwargs: {kwargs}")
+        response = none_approach(original_messages=messages, client=client, model=model, request_id=request_id, **kwargs)
+        # For none approach, we return the response and a token count of 0
+        # since the full token count is already in the response
+        return response, 0
+
+    dispatch = APPROACH_DISPATCH.get(approach)
+    if dispatch is not None:
+        return dispatch(system_prompt, initial_query, client, model, request_config, request_id)
+
+    if approach in plugin_approaches:
+        entry = plugin_approaches[approach]
+        if entry is None:
+            # Discovered but not yet imported; load on first use
+            entry = _load_plugin(approach)
+        # Reflection over the plugin was done once at load time
+        plugin_func, is_async, accepts_request_config = entry
 
         if is_async:
-            # For async functions, we need to run them in an event loop
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                if 'request_config' in sig.parameters:
-                    # Plugin supports request_config
-                    result = loop.run_until_complete(plugin_func(system_prompt, initial_query, client, model, request_config=request_config))
-                else:
-                    # Legacy plugin without request_config support
-                    result = loop.run_until_complete(plugin_func(system_prompt, initial_query, client, model))
-                return result
-            finally:
-                loop.close()
+            # Async plugins run on the shared background loop rather than a
+            # per-request event loop
+            if accepts_request_config:
+                # Plugin supports request_config
+                coro = plugin_func(system_prompt, initial_query, client, model, request_config=request_config)
+            else:
+                # Legacy plugin without request_config support
+                coro = plugin_func(system_prompt, initial_query, client, model)
+            return asyncio.run_coroutine_threadsafe(coro, get_shared_event_loop()).result()
         else:
             # For synchronous functions, call directly
-            if 'request_config' in sig.parameters:
+            if accepts_request_config:
                 # Plugin supports request_config
                 return plugin_func(system_prompt, initial_query, client, model, request_config=request_config)
             else:
@@ -521,19 +771,45 @@ def execute_n_times(n: int, approaches, operation: str, system_prompt: str, init
     responses = []
     total_tokens = 0
 
-    for _ in range(n):
+    # The 'none' approach forwards n to the underlying endpoint, which
+    # generates all completions server-side in a single call, so there is
+    # no need to run the pipeline n times.
+    if operation == 'SINGLE' and approaches[0] == 'none':
+        return execute_single_approach(approaches[0], system_prompt, initial_query, client, model, request_config, request_id)
+
+    def run_pipeline_sync():
         if operation == 'SINGLE':
-            response, tokens = execute_single_approach(approaches[0], system_prompt, initial_query, client, model, request_config, request_id)
+            return execute_single_approach(approaches[0], system_prompt, initial_query, client, model, request_config, request_id)
         elif operation == 'AND':
-            response, tokens = execute_combined_approaches(approaches, system_prompt, initial_query, client, model, request_config)
-        elif operation == 'OR':
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            response, tokens = loop.run_until_complete(execute_parallel_approaches(approaches, system_prompt, initial_query, client, model, request_config))
-            loop.close()
+            return execute_combined_approaches(approaches, system_prompt, initial_query, client, model, request_config)
         else:
             raise ValueError(f"Unknown operation: {operation}")
 
+    if n == 1:
+        if operation == 'OR':
+            results = [asyncio.run_coroutine_threadsafe(
+                execute_parallel_approaches(approaches, system_prompt, initial_query, client, model, request_config),
+                get_shared_event_loop()).result()]
+        else:
+            results = [run_pipeline_sync()]
+    else:
+        # Run the n pipeline iterations concurrently on the shared event loop
+        # instead of issuing n sequential runs. OR iterations are awaited
+        # natively on the loop: running them via to_thread would have each
+        # outer iteration block a slot of the loop's bounded default
+        # executor while the inner per-approach to_thread tasks wait for a
+        # slot of the same executor — a deadlock once n fills it.
+        async def run_pipeline_iteration():
+            if operation == 'OR':
+                return await execute_parallel_approaches(approaches, system_prompt, initial_query, client, model, request_config)
+            return await asyncio.to_thread(run_pipeline_sync)
+
+        async def run_pipeline_n_times():
+            return await asyncio.gather(*[run_pipeline_iteration() for _ in range(n)])
+
+        results = asyncio.run_coroutine_threadsafe(run_pipeline_n_times(), get_shared_event_loop()).result()
+
+    for response, tokens in results:
         # If response is already a list (from OR operation), extend responses
         # Otherwise append the single response
         if isinstance(response, list):
@@ -548,6 +824,15 @@ def execute_n_times(n: int, approaches, operation: str, system_prompt: str, init
         return responses[0], total_tokens
     return responses, total_tokens
 
+if orjson is not None:
+    def _sse_event(payload):
+        return b"data: " + orjson.dumps(payload) + b"\n\n"
+    _SSE_DONE = b"data: [DONE]\n\n"
+else:
+    def _sse_event(payload):
+        return "data: " + json.dumps(payload) + "\n\n"
+    _SSE_DONE = "data: [DONE]\n\n"
+
 def generate_streaming_response(final_response, model):
     # Generate a unique response ID
     response_id = f"chatcmpl-{int(time.time()*1000)}"
@@ -557,25 +842,75 @@ def generate_streaming_response(final_response, model):
     if isinstance(final_response, list):
         for index, response in enumerate(final_response):
             # First chunk includes role
-            yield "data: " + json.dumps({
+            yield _sse_event({
                 "id": response_id,
                 "object": "chat.completion.chunk",
                 "created": created,
                 "model": model,
                 "choices": [{"delta": {"role": "assistant", "content": response}, "index": index, "finish_reason": "stop"}],
-            }) + "\n\n"
+            })
     else:
         # First chunk includes role
-        yield "data: " + json.dumps({
+        yield _sse_event({
             "id": response_id,
             "object": "chat.completion.chunk",
             "created": created,
             "model": model,
             "choices": [{"delta": {"role": "assistant", "content": final_response}, "index": 0, "finish_reason": "stop"}],
-        }) + "\n\n"
+        })
 
     # Yield the final message to indicate the stream has ended
-    yield "data: [DONE]\n\n"
+    yield _SSE_DONE
+
+def generate_streaming_passthrough(stream_response, request_id=None):
+    """Forward provider streaming chunks to the client as they arrive.
+
+    The deltas are also accumulated so conversation logging records the
+    assembled response (or a mid-stream provider error) once the stream
+    finishes, matching what the buffered path logs.
+    """
+    logging_enabled = conversation_logger is not None and request_id is not None
+    contents = {}
+    finish_reasons = {}
+    last_chunk = None
+    try:
+        for chunk in stream_response:
+            chunk_dict = chunk.model_dump() if hasattr(chunk, 'model_dump') else chunk
+            if logging_enabled:
+                last_chunk = chunk_dict
+                for choice in chunk_dict.get('choices') or []:
+                    index = choice.get('index', 0)
+                    delta = choice.get('delta') or {}
+                    if delta.get('content'):
+                        contents.setdefault(index, []).append(delta['content'])
+                    if choice.get('finish_reason'):
+                        finish_reasons[index] = choice['finish_reason']
+            yield _sse_event(chunk_dict)
+    except Exception as e:
+        if logging_enabled:
+            conversation_logger.log_error(request_id, f"Provider error mid-stream: {e}")
+            conversation_logger.finalize_conversation(request_id)
+        raise
+
+    if logging_enabled:
+        final_response = {
+            "id": (last_chunk or {}).get("id"),
+            "model": (last_chunk or {}).get("model"),
+            "choices": [
+                {
+                    "index": index,
+                    "message": {"role": "assistant", "content": "".join(parts)},
+                    "finish_reason": finish_reasons.get(index),
+                }
+                for index, parts in sorted(contents.items())
+            ],
+        }
+        if last_chunk and last_chunk.get("usage"):
+            final_response["usage"] = last_chunk["usage"]
+        conversation_logger.log_final_response(request_id, final_response)
+        conversation_logger.finalize_conversation(request_id)
+
+    yield _SSE_DONE
 
 def extract_contents(response_obj):
     contents = []
@@ -592,35 +927,34 @@ def extract_contents(response_obj):
 
     return contents
 
+_USER_PREFIX = "User: "
+_ASSISTANT_PREFIX = "Assistant: "
+
 def parse_conversation(messages):
     system_prompt = ""
-    conversation = []
+    parts = []
     optillm_approach = None
 
     for message in messages:
         role = message['role']
-        content = message['content']
-
         # Handle content that could be a list or string
-        if isinstance(content, list):
-            # Extract text content from the list
-            text_content = ' '.join(
-                item['text'] for item in content
-                if isinstance(item, dict) and item.get('type') == 'text'
-            )
-        else:
-            text_content = content
+        text_content = _flatten_content(message['content'])
 
         if role == 'system':
             system_prompt, optillm_approach = extract_optillm_approach(text_content)
         elif role == 'user':
             if not optillm_approach:
                 text_content, optillm_approach = extract_optillm_approach(text_content)
-            conversation.append(f"User: {text_content}")
+            parts.append(_USER_PREFIX)
+            parts.append(text_content)
+            parts.append("\n")
         elif role == 'assistant':
-            conversation.append(f"Assistant: {text_content}")
+            parts.append(_ASSISTANT_PREFIX)
+            parts.append(text_content)
+            parts.append("\n")
 
-    initial_query = "\n".join(conversation)
+    # Join once at the end instead of allocating an f-string per message
+    initial_query = "".join(parts[:-1]) if parts else ""
     return system_prompt, initial_query, optillm_approach
 
 def tagged_conversation_to_messages(response_text):
@@ -644,7 +978,7 @@ def tagged_conversation_to_messages(response_text):
 
         messages = []
         # Split on "User:" or "Assistant:" while keeping the delimiter
-        parts = re.split(r'(?=(User:|Assistant:))', text.strip())
+        parts = _CONVERSATION_TAG_RE.split(text.strip())
         # Remove empty strings
         parts = [p for p in parts if p.strip()]
 
@@ -672,10 +1006,13 @@ def tagged_conversation_to_messages(response_text):
         return process_single_response(response_text or "")
 
 def extract_optillm_approach(content):
-    match = re.search(r'<optillm_approach>(.*?)</optillm_approach>', content)
+    # Cheap membership test first; most messages carry no approach tag
+    if '<optillm_approach>' not in content:
+        return content, None
+    match = _APPROACH_TAG_RE.search(content)
     if match:
         approach = match.group(1)
-        content = re.sub(r'<optillm_approach>.*?</optillm_approach>', '', content).strip()
+        content = (content[:match.start()] + content[match.end():]).strip()
         return content, approach
     return content, None
 
@@ -694,10 +1031,24 @@ def check_api_key():
         if not secrets.compare_digest(client_key, server_config['optillm_api_key']):
             return jsonify({"error": "Invalid API key"}), 401
 
+def _request_json():
+    """Decode the request body, using orjson when available.
+
+    orjson parses the large chat-history payloads the proxy sees several
+    times faster than Flask's stdlib-json path; malformed bodies fall back
+    to request.get_json() so the standard 400 handling still applies.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(request.get_data())
+        except orjson.JSONDecodeError:
+            pass
+    return request.get_json()
+
 @app.route('/v1/chat/completions', methods=['POST'])
 def proxy():
     logger.info('Received request to /v1/chat/completions')
-    data = request.get_json()
+    data = _request_json()
     auth_header = request.headers.get("Authorization")
     bearer_token = ""
 
@@ -743,10 +1094,6 @@ def proxy():
         request_config['max_tokens'] = max_tokens
 
     optillm_approach = data.get('optillm_approach', server_config['approach'])
-    logger.debug(data)
-    server_config['mcts_depth'] = data.get('mcts_depth', server_config['mcts_depth'])
-    server_config['mcts_exploration'] = data.get('mcts_exploration', server_config['mcts_exploration'])
-    server_config['mcts_simulations'] = data.get('mcts_simulations', server_config['mcts_simulations'])
 
     system_prompt, initial_query, message_optillm_approach = parse_conversation(messages)
 
@@ -784,10 +1131,7 @@ def proxy():
 
     if bearer_token != "" and bearer_token.startswith("sk-"):
         api_key = bearer_token
-        if base_url != "":
-            client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            client = OpenAI(api_key=api_key)
+        client = _client_for_token(api_key, base_url)
     else:
         client = default_client
 
@@ -818,12 +1162,21 @@ def proxy():
                 return jsonify({"error": str(e)}), 500
 
         # Check if any of the approaches is 'none'
-        contains_none = any(approach == 'none' for approach in approaches)
+        contains_none = 'none' in approaches
 
         if operation == 'SINGLE' and approaches[0] == 'none':
             # Pass through the request including the n parameter
             result, completion_tokens = execute_single_approach(approaches[0], system_prompt, initial_query, client, model, request_config, request_id)
 
+            if stream:
+                # result is the provider's streaming iterator; forward each
+                # delta as it arrives rather than buffering the completion.
+                # The generator logs and finalizes the conversation itself
+                # once the stream completes.
+                if request_id:
+                    logger.info(f'Request {request_id}: Completed (streaming response)')
+                return Response(generate_streaming_passthrough(result, request_id), content_type='text/event-stream', direct_passthrough=True)
+
             logger.debug(f'Direct proxy response: {result}')
 
             # Log the final response and finalize conversation logging
@@ -831,14 +1184,9 @@ def proxy():
                 conversation_logger.log_final_response(request_id, result)
                 conversation_logger.finalize_conversation(request_id)
 
-            if stream:
-                if request_id:
-                    logger.info(f'Request {request_id}: Completed (streaming response)')
-                return Response(generate_streaming_response(extract_contents(result), model), content_type='text/event-stream')
-            else :
-                if request_id:
-                    logger.info(f'Request {request_id}: Completed')
-                return jsonify(result), 200
+            if request_id:
+                logger.info(f'Request {request_id}: Completed')
+            return jsonify(result), 200
 
         elif operation == 'AND' or operation == 'OR':
             if contains_none:
@@ -979,7 +1327,170 @@ def proxy_models():
 def health():
     return jsonify({"status": "ok"}), 200
 
-def parse_args():
+_BOOL_TRUTHY = frozenset({'true', '1', 'yes'})
+
+# Coercers for turning environment-variable strings into argument defaults
+_COERCERS = {
+    bool: lambda s: s.lower() in _BOOL_TRUTHY,
+    int: int,
+    float: float,
+    str: str,
+}
+
+class ArgSpec(NamedTuple):
+    flag: str
+    env: str
+    type: type
+    default: Any
+    help: str
+    # Static tuple of choices, or a callable evaluated at registration time
+    # for choice sets that depend on runtime state (e.g. discovered plugins)
+    choices: Any = None
+
+# Built once at import time as an immutable tuple; parse_args consumes it
+# without re-allocating per-entry tuples on every invocation
+_ARG_SPECS = (
+    ArgSpec("--optillm-api-key", "OPTILLM_API_KEY", str, "", "Optional API key for client authentication to optillm"),
+    ArgSpec("--approach", "OPTILLM_APPROACH", str, "auto", "Inference approach to use",
+            lambda: sorted(known_approaches) + list(plugin_approaches.keys())),
+    ArgSpec("--mcts-simulations", "OPTILLM_SIMULATIONS", int, 2, "Number of MCTS simulations"),
+    ArgSpec("--mcts-exploration", "OPTILLM_EXPLORATION", float, 0.2, "Exploration weight for MCTS"),
+    ArgSpec("--mcts-depth", "OPTILLM_DEPTH", int, 1, "Simulation depth for MCTS"),
+    ArgSpec("--model", "OPTILLM_MODEL", str, "gpt-4o-mini", "OpenAI model to use"),
+    ArgSpec("--rstar-max-depth", "OPTILLM_RSTAR_MAX_DEPTH", int, 3, "Maximum depth for rStar algorithm"),
+    ArgSpec("--rstar-num-rollouts", "OPTILLM_RSTAR_NUM_ROLLOUTS", int, 5, "Number of rollouts for rStar algorithm"),
+    ArgSpec("--rstar-c", "OPTILLM_RSTAR_C", float, 1.4, "Exploration constant for rStar algorithm"),
+    ArgSpec("--n", "OPTILLM_N", int, 1, "Number of final responses to be returned"),
+    ArgSpec("--return-full-response", "OPTILLM_RETURN_FULL_RESPONSE", bool, False, "Return the full response including the CoT with <thinking> tags"),
+    ArgSpec("--host", "OPTILLM_HOST", str, "127.0.0.1", "Host address to bind the server to (use 0.0.0.0 to allow external connections)"),
+    ArgSpec("--port", "OPTILLM_PORT", int, 8000, "Specify the port to run the proxy"),
+    ArgSpec("--log", "OPTILLM_LOG", str, "info", "Specify the logging level", tuple(logging_levels)),
+    ArgSpec("--server", "OPTILLM_SERVER", str, "waitress", "WSGI server used to serve the proxy", ("dev", "waitress", "gunicorn")),
+    ArgSpec("--launch-gui", "OPTILLM_LAUNCH_GUI", bool, False, "Launch a Gradio chat interface"),
+    ArgSpec("--plugins-dir", "OPTILLM_PLUGINS_DIR", str, "", "Path to the plugins directory"),
+    ArgSpec("--log-conversations", "OPTILLM_LOG_CONVERSATIONS", bool, False, "Enable conversation logging with full metadata"),
+    ArgSpec("--conversation-log-dir", "OPTILLM_CONVERSATION_LOG_DIR", str, str(Path.home() / ".optillm" / "conversations"), "Directory to save conversation logs"),
+)
+
+# Every environment variable parse_args consults, gathered so the
+# environment is scanned once per invocation instead of per argument
+_ALL_OPTILLM_ENV_KEYS = tuple(spec.env for spec in _ARG_SPECS) + (
+    "OPTILLM_BEST_OF_N",
+    "OPTILLM_BASE_URL",
+    "OPTILLM_SSL_VERIFY",
+    "OPTILLM_SSL_CERT_PATH",
+    "OPTILLM_BATCH_MODE",
+    "OPTILLM_BATCH_SIZE",
+    "OPTILLM_BATCH_WAIT_MS",
+)
+
+def _args_cache_path(argv):
+    """Cache file for the parsed namespace, keyed by argv, relevant env, and cwd.
+
+    The namespace embeds cwd-dependent defaults (the CePO config path
+    resolves against the working directory), so the same argv started from
+    a different directory must not share a cache entry.
+    """
+    import hashlib
+    env_values = [os.environ.get(key) for key in _ALL_OPTILLM_ENV_KEYS]
+    key = hashlib.blake2b(repr((argv, env_values, os.getcwd())).encode(), digest_size=16).hexdigest()
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(cache_root) / 'optillm' / f'args-{key}.pkl'
+
+def _load_cached_args(cache_path):
+    import pickle
+    try:
+        cache_mtime = cache_path.stat().st_mtime
+        # A newer module or CePO config invalidates the cached namespace
+        if cache_mtime <= os.path.getmtime(__file__):
+            return None
+        config_path = get_config_path()
+        if os.path.exists(config_path) and cache_mtime <= os.path.getmtime(config_path):
+            return None
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+
+def _store_cached_args(cache_path, args):
+    import pickle
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(args, f)
+    except OSError as e:
+        logger.debug("Could not write args cache %s: %s", cache_path, e)
+
+def _register(parser, spec, environ):
+    """Add one argument from its spec, honoring the environment override."""
+    default = spec.default
+    env_value = environ.get(spec.env)
+    if env_value is not None:
+        default = _COERCERS[spec.type](env_value)
+    choices = spec.choices() if callable(spec.choices) else spec.choices
+    if choices:
+        parser.add_argument(spec.flag, type=spec.type, default=default, help=spec.help, choices=choices)
+    elif spec.type == bool:
+        # --flag/--no-flag pair that honors a True default from the
+        # environment, which store_true silently ignored
+        parser.add_argument(spec.flag, action=argparse.BooleanOptionalAction, default=default, help=spec.help)
+    else:
+        parser.add_argument(spec.flag, type=spec.type, default=default, help=spec.help)
+
+def _wants_cepo_args(argv):
+    """Check whether the CePO per-field flags need to be registered."""
+    if os.environ.get("OPTILLM_APPROACH") == "cepo":
+        return True
+    if "cepo" in argv:  # positional value of --approach cepo
+        return True
+    return any(arg.startswith("--cepo") and not arg.startswith("--cepo_config_file")
+               for arg in argv) or any(arg.startswith("--approach") and "cepo" in arg
+                                       for arg in argv)
+
+def add_cepo_args(parser):
+    """Register one --cepo_<field> flag per CepoConfig field."""
+    from dataclasses import fields
+    from optillm.cepo.cepo import CepoConfig
+
+    for field in fields(CepoConfig):
+        parser.add_argument(f"--cepo_{field.name}",
+                        dest=f"cepo_{field.name}",
+                        type=field.type,
+                        default=None,
+                        help=f"CePO configuration for {field.name}")
+
+def _intern_args(args):
+    """Intern namespace keys (and enum-like values) destined for server_config.
+
+    These strings live for the whole process and are dict-probed on every
+    request, so interning lets the lookups compare by identity.
+    """
+    args.__dict__ = {
+        sys.intern(key): (sys.intern(value)
+                          if key in ('approach', 'log') and isinstance(value, str)
+                          else value)
+        for key, value in vars(args).items()
+    }
+    return args
+
+def parse_args(argv=None):
+    # argv defaults to the process arguments; create_app passes [] because
+    # gunicorn workers carry gunicorn's own argv, not optillm's
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Opt-in fast path: with --cache-args, a namespace parsed earlier for
+    # the same argv and environment is reused, skipping the parser build
+    # entirely. Checked against the raw argv since the flag gates whether
+    # the parser is constructed at all.
+    cache_args = '--cache-args' in argv
+    cache_path = None
+    if cache_args:
+        cache_path = _args_cache_path(argv)
+        cached = _load_cached_args(cache_path)
+        if cached is not None:
+            return _intern_args(cached)
+
     parser = argparse.ArgumentParser(description="Run LLM inference with various approaches.")
 
     try:
@@ -991,63 +1502,34 @@ def parse_args():
                        version=f'%(prog)s {package_version}',
                        help="Show program's version number and exit")
 
-    # Define arguments and their corresponding environment variables
-    args_env = [
-        ("--optillm-api-key", "OPTILLM_API_KEY", str, "", "Optional API key for client authentication to optillm"),
-        ("--approach", "OPTILLM_APPROACH", str, "auto", "Inference approach to use", known_approaches + list(plugin_approaches.keys())),
-        ("--mcts-simulations", "OPTILLM_SIMULATIONS", int, 2, "Number of MCTS simulations"),
-        ("--mcts-exploration", "OPTILLM_EXPLORATION", float, 0.2, "Exploration weight for MCTS"),
-        ("--mcts-depth", "OPTILLM_DEPTH", int, 1, "Simulation depth for MCTS"),
-        ("--model", "OPTILLM_MODEL", str, "gpt-4o-mini", "OpenAI model to use"),
-        ("--rstar-max-depth", "OPTILLM_RSTAR_MAX_DEPTH", int, 3, "Maximum depth for rStar algorithm"),
-        ("--rstar-num-rollouts", "OPTILLM_RSTAR_NUM_ROLLOUTS", int, 5, "Number of rollouts for rStar algorithm"),
-        ("--rstar-c", "OPTILLM_RSTAR_C", float, 1.4, "Exploration constant for rStar algorithm"),
-        ("--n", "OPTILLM_N", int, 1, "Number of final responses to be returned"),
-        ("--return-full-response", "OPTILLM_RETURN_FULL_RESPONSE", bool, False, "Return the full response including the CoT with <thinking> tags"),
-        ("--host", "OPTILLM_HOST", str, "127.0.0.1", "Host address to bind the server to (use 0.0.0.0 to allow external connections)"),
-        ("--port", "OPTILLM_PORT", int, 8000, "Specify the port to run the proxy"),
-        ("--log", "OPTILLM_LOG", str, "info", "Specify the logging level", list(logging_levels.keys())),
-        ("--launch-gui", "OPTILLM_LAUNCH_GUI", bool, False, "Launch a Gradio chat interface"),
-        ("--plugins-dir", "OPTILLM_PLUGINS_DIR", str, "", "Path to the plugins directory"),
-        ("--log-conversations", "OPTILLM_LOG_CONVERSATIONS", bool, False, "Enable conversation logging with full metadata"),
-        ("--conversation-log-dir", "OPTILLM_CONVERSATION_LOG_DIR", str, str(Path.home() / ".optillm" / "conversations"), "Directory to save conversation logs"),
-    ]
-
-    for arg, env, type_, default, help_text, *extra in args_env:
-        env_value = os.environ.get(env)
-        if env_value is not None:
-            if type_ == bool:
-                default = env_value.lower() in ('true', '1', 'yes')
-            else:
-                default = type_(env_value)
-        if extra and extra[0]:  # Check if there are choices for this argument
-            parser.add_argument(arg, type=type_, default=default, help=help_text, choices=extra[0])
-        else:
-            if type_ == bool:
-                # For boolean flags, use store_true action
-                parser.add_argument(arg, action='store_true', default=default, help=help_text)
-            else:
-                parser.add_argument(arg, type=type_, default=default, help=help_text)
+    # Snapshot the relevant environment variables with a single scan;
+    # os.environ lookups go through a key-normalizing proxy on every call
+    env = os.environ
+    relevant = {key: env[key] for key in _ALL_OPTILLM_ENV_KEYS if key in env}
+
+    # Register the declarative argument table
+    for spec in _ARG_SPECS:
+        _register(parser, spec, relevant)
 
     # Special handling for best_of_n to support both formats
-    best_of_n_default = int(os.environ.get("OPTILLM_BEST_OF_N", 3))
+    best_of_n_default = int(relevant.get("OPTILLM_BEST_OF_N", 3))
     parser.add_argument("--best-of-n", "--best_of_n", dest="best_of_n", type=int, default=best_of_n_default,
                         help="Number of samples for best_of_n approach")
 
     # Special handling for base_url to support both formats
-    base_url_default = os.environ.get("OPTILLM_BASE_URL", "")
+    base_url_default = relevant.get("OPTILLM_BASE_URL", "")
     parser.add_argument("--base-url", "--base_url", dest="base_url", type=str, default=base_url_default,
                         help="Base url for OpenAI compatible endpoint")
 
     # SSL configuration arguments
-    ssl_verify_default = os.environ.get("OPTILLM_SSL_VERIFY", "true").lower() in ("true", "1", "yes")
+    ssl_verify_default = relevant.get("OPTILLM_SSL_VERIFY", "true").lower() in ("true", "1", "yes")
     parser.add_argument("--ssl-verify", dest="ssl_verify", action="store_true" if ssl_verify_default else "store_false",
                         default=ssl_verify_default,
                         help="Enable SSL certificate verification (default: True)")
     parser.add_argument("--no-ssl-verify", dest="ssl_verify", action="store_false",
                         help="Disable SSL certificate verification")
 
-    ssl_cert_path_default = os.environ.get("OPTILLM_SSL_CERT_PATH", "")
+    ssl_cert_path_default = relevant.get("OPTILLM_SSL_CERT_PATH", "")
     parser.add_argument("--ssl-cert-path", dest="ssl_cert_path", type=str, default=ssl_cert_path_default,
                         help="Path to custom CA certificate bundle for SSL verification")
 
@@ -1055,9 +1537,9 @@ def parse_args():
     default_config_path = get_config_path()
 
     # Batch mode arguments
-    batch_mode_default = os.environ.get("OPTILLM_BATCH_MODE", "false").lower() == "true"
-    batch_size_default = int(os.environ.get("OPTILLM_BATCH_SIZE", 4))
-    batch_wait_ms_default = int(os.environ.get("OPTILLM_BATCH_WAIT_MS", 50))
+    batch_mode_default = relevant.get("OPTILLM_BATCH_MODE", "false").lower() == "true"
+    batch_size_default = int(relevant.get("OPTILLM_BATCH_SIZE", 4))
+    batch_wait_ms_default = int(relevant.get("OPTILLM_BATCH_WAIT_MS", 50))
 
     parser.add_argument("--batch-mode", action="store_true", default=batch_mode_default,
                         help="Enable automatic request batching (fail-fast, no fallback)")
@@ -1066,13 +1548,14 @@ def parse_args():
     parser.add_argument("--batch-wait-ms", dest="batch_wait_ms", type=int, default=batch_wait_ms_default,
                         help="Maximum wait time in milliseconds for batch formation")
 
-    # Special handling of all the CePO Configurations
-    for field in fields(CepoConfig):
-        parser.add_argument(f"--cepo_{field.name}",
-                        dest=f"cepo_{field.name}",
-                        type=field.type,
-                        default=None,
-                        help=f"CePO configuration for {field.name}")
+    # Special handling of all the CePO Configurations. The per-field flags
+    # are only registered when CePO is actually selected (via --approach,
+    # OPTILLM_APPROACH, or an explicit --cepo_* flag), so the dataclass
+    # reflection loop is skipped on every other startup. --cepo_config_file
+    # stays registered unconditionally since init_cepo_config reads it even
+    # when CePO is picked per request via the model prefix.
+    if _wants_cepo_args(argv):
+        add_cepo_args(parser)
 
     parser.add_argument("--cepo_config_file",
                     dest="cepo_config_file",
@@ -1080,26 +1563,29 @@ def parse_args():
                     default=default_config_path,
                     help="Path to CePO configuration file")
 
-    args = parser.parse_args()
+    parser.add_argument("--cache-args", action="store_true", default=False,
+                        help="Cache the parsed arguments keyed by argv and environment to speed up restarts")
 
-    # Convert argument names to match server_config keys
-    args_dict = vars(args)
-    for key in list(args_dict.keys()):
-        new_key = key.replace("-", "_")
-        if new_key != key:
-            args_dict[new_key] = args_dict.pop(key)
+    # argparse already derives underscore dests from hyphenated long
+    # options (--mcts-simulations -> mcts_simulations), and the remaining
+    # dual-format flags set dest= explicitly, so no key rewriting is needed
+    args = parser.parse_args(argv)
 
-    return args
+    if cache_args:
+        _store_cached_args(cache_path, args)
+
+    return _intern_args(args)
 
 def main():
     global server_config
-    global cepo_config
     global request_batcher
     global conversation_logger
     # Call this function at the start of main()
 
     # Load plugins first so they're available in argument parser
-    load_plugins()
+    # Record plugin slugs without importing the plugin modules; each module
+    # is imported on first use of its approach
+    discover_plugins()
 
     args = parse_args()
     # Update server_config with all argument values
@@ -1173,7 +1659,7 @@ def main():
                         raise BatchingError("Streaming requests cannot be batched")
 
                     # Check if any of the approaches is 'none'
-                    contains_none = any(approach == 'none' for approach in approaches)
+                    contains_none = 'none' in approaches
 
                     if operation == 'SINGLE' and approaches[0] == 'none':
                         # Pass through the request including the n parameter
@@ -1249,9 +1735,10 @@ def main():
         request_batcher.set_processor(process_batch_requests)
 
     # Set logging level from user request
-    logging_level = server_config['log']
-    if logging_level in logging_levels.keys():
-        logger.setLevel(logging_levels[logging_level])
+    # Single lookup with a sane fallback; argparse choices already
+    # constrain the value
+    level = logging_levels.get(server_config['log'], logging.INFO)
+    logger.setLevel(level)
 
     # Initialize conversation logger if enabled
     global conversation_logger
@@ -1264,77 +1751,131 @@ def main():
     if server_config['log_conversations']:
         logger.info(f"Conversation logging enabled. Logs will be saved to: {server_config['conversation_log_dir']}")
 
-    # set and log the cepo configs
-    cepo_config = init_cepo_config(server_config)
+    # Build the cepo config only when CePO is selected at startup;
+    # per-request selection via the model prefix goes through the cached
+    # get_cepo_config() accessor on first use
     if args.approach == 'cepo':
-        logger.info(f"CePO Config: {cepo_config}")
+        logger.info(f"CePO Config: {get_cepo_config()}")
 
     logger.info(f"Starting server with approach: {server_config['approach']}")
-    server_config_clean = server_config.copy()
-    if server_config_clean['optillm_api_key']:
-        server_config_clean['optillm_api_key'] = '[REDACTED]'
-    logger.info(f"Server configuration: {server_config_clean}")
-
-    # Launch GUI if requested
+    # Log a redacted view without copying the whole config dict, and skip
+    # building it entirely when INFO is suppressed
+    if logger.isEnabledFor(logging.INFO):
+        redacted = {k: ('[REDACTED]' if k == 'optillm_api_key' and v else v)
+                    for k, v in server_config.items()}
+        # orjson serializes the dict far faster than its repr
+        logger.info("Server configuration: %s",
+                    orjson.dumps(redacted, default=str).decode() if orjson is not None else redacted)
+
+    # Launch GUI if requested; optillm.gui is imported lazily so the
+    # non-GUI path never pays the gradio import cost
     if server_config.get('launch_gui'):
         try:
-            import gradio as gr
-            # Start server in a separate thread
-            import threading
-            host = server_config['host']
-            server_thread = threading.Thread(target=app.run, kwargs={'host': host, 'port': port})
-            server_thread.daemon = True
-            server_thread.start()
-
-            # Configure the base URL for the Gradio interface
-            base_url = f"http://localhost:{port}/v1"
-            logger.info(f"Launching Gradio interface connected to {base_url}")
-
-            # Create custom chat function with extended timeout
-            def chat_with_optillm(message, history):
-                import httpx
-                from openai import OpenAI
-
-                # Create client with extended timeout and no retries
-                custom_client = OpenAI(
-                    api_key="optillm",
-                    base_url=base_url,
-                    timeout=httpx.Timeout(1800.0, connect=5.0),  # 30 min timeout
-                    max_retries=0  # No retries - prevents duplicate requests
-                )
-
-                # Convert history to messages format
-                messages = []
-                for h in history:
-                    if h[0]:  # User message
-                        messages.append({"role": "user", "content": h[0]})
-                    if h[1]:  # Assistant message
-                        messages.append({"role": "assistant", "content": h[1]})
-                messages.append({"role": "user", "content": message})
-
-                # Make request
-                try:
-                    response = custom_client.chat.completions.create(
-                        model=server_config['model'],
-                        messages=messages
-                    )
-                    return response.choices[0].message.content
-                except Exception as e:
-                    return f"Error: {str(e)}"
-
-            # Create Gradio interface with queue for long operations
-            demo = gr.ChatInterface(
-                chat_with_optillm,
-                title="OptILLM Chat Interface",
-                description=f"Connected to OptILLM proxy at {base_url}"
-            )
-            demo.queue()  # Enable queue to handle long operations properly
-            demo.launch(server_name=host, share=False)
+            from optillm.gui import launch
         except ImportError:
             logger.error("Gradio is required for GUI. Install it with: pip install gradio")
             return
+        launch(app, host=server_config['host'], port=port, model=server_config['model'])
+        return
+
+    run_server(host=server_config['host'], port=port, backend=server_config.get('server', 'waitress'))
+
+# Destination-name -> environment variable for the flags that are not in
+# _ARG_SPECS; used when handing the effective config to exec'd workers
+_EXTRA_ENV_DESTS = (
+    ("best_of_n", "OPTILLM_BEST_OF_N"),
+    ("base_url", "OPTILLM_BASE_URL"),
+    ("ssl_verify", "OPTILLM_SSL_VERIFY"),
+    ("ssl_cert_path", "OPTILLM_SSL_CERT_PATH"),
+    ("batch_mode", "OPTILLM_BATCH_MODE"),
+    ("batch_size", "OPTILLM_BATCH_SIZE"),
+    ("batch_wait_ms", "OPTILLM_BATCH_WAIT_MS"),
+)
+
+def _export_config_env():
+    """Mirror the effective config into OPTILLM_* environment variables.
+
+    gunicorn workers never see optillm's CLI arguments, so before exec'ing
+    gunicorn the parsed configuration is written back to the environment,
+    where create_app() picks it up in each worker.
+    """
+    dest_env = [(spec.flag[2:].replace('-', '_'), spec.env) for spec in _ARG_SPECS]
+    for dest, env_key in dest_env + list(_EXTRA_ENV_DESTS):
+        value = server_config.get(dest)
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        os.environ[env_key] = str(value)
+
+def create_app():
+    """App factory for WSGI servers whose workers import the app directly.
+
+    gunicorn workers never run main(), so plugin discovery and
+    configuration have to happen here instead. Settings arrive through the
+    OPTILLM_* environment variables that run_server exports before exec.
+    """
+    global conversation_logger
+    discover_plugins()
+    args = parse_args([])
+    server_config.update(vars(args))
+    logger.setLevel(logging_levels.get(server_config['log'], logging.INFO))
+    conversation_logger = ConversationLogger(
+        log_dir=Path(server_config['conversation_log_dir']),
+        enabled=server_config['log_conversations']
+    )
+    optillm.conversation_logger.set_global_logger(conversation_logger)
+    return app
+
+def run_server(host: str, port: int, backend: str = 'waitress'):
+    """Serve the Flask app with the selected WSGI server.
+
+    Long-running LLM requests hold a worker for seconds to minutes, so the
+    default is waitress: a production WSGI server whose thread pool
+    multiplexes in-flight requests and whose persistent connections avoid a
+    TCP/TLS handshake per request. 'gunicorn' execs a gthread gunicorn for
+    multi-process deployments, and 'dev' keeps the Werkzeug dev server for
+    debugging.
+    """
+    import shutil
+
+    threads = max(16, (os.cpu_count() or 1) * 4)
+
+    if backend == 'gunicorn':
+        if server_config.get('batch_mode'):
+            # The request batcher and its processor live in main() and are
+            # per-process state; gunicorn workers would silently run
+            # unbatched, so keep the single-process server instead
+            logger.warning("Request batching is not supported with the gunicorn backend; "
+                           "falling back to waitress.")
+            backend = 'waitress'
+        elif shutil.which("gunicorn") is None:
+            logger.warning("gunicorn is not installed; falling back to waitress. "
+                           "Install it with: pip install gunicorn")
+            backend = 'waitress'
+        else:
+            workers = (os.cpu_count() or 1)
+            # Replace this process; each gunicorn worker rebuilds the app
+            # through create_app(), which re-applies the exported config
+            # and rediscovers plugins.
+            _export_config_env()
+            logger.info(f"Execing gunicorn with {workers} workers x {threads} threads on {host}:{port}")
+            os.execvp("gunicorn", ["gunicorn", "-w", str(workers), "-k", "gthread",
+                                   "--threads", str(threads), "--timeout", "1800",
+                                   "-b", f"{host}:{port}", "optillm.server:create_app()"])
+
+    if backend == 'waitress':
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress is not installed; falling back to the Flask development server. "
+                           "Install it with: pip install waitress")
+        else:
+            logger.info(f"Serving on http://{host}:{port} with waitress ({threads} threads)")
+            serve(app, host=host, port=port, threads=threads, channel_timeout=1800)
+            return
 
-    app.run(host=server_config['host'], port=port)
+    app.run(host=host, port=port)
 
 if __name__ == "__main__":
     main()
@@ -1,27 +1,49 @@
 import argparse
+import asyncio
 import json
 import os
 import logging
 import re
-from typing import Dict, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, TextIO, Union
+
+import httpx
+import numpy as np
 from datasets import load_dataset
 from tqdm import tqdm
-from openai import OpenAI
-
-# Enhanced logging configuration
-# logging.basicConfig(
-#     level=logging.DEBUG,
-#     format='%(asctime)s - %(levelname)s - %(message)s',
-#     handlers=[
-#         logging.FileHandler('math500_debug.log'),
-#         logging.StreamHandler()
-#     ]
-# )
+from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI(api_key="optillm", base_url="http://localhost:8000/v1")
-# client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), base_url="https://openrouter.ai/api/v1")
+def _build_client(max_connections: int = 64, http2: bool = False) -> AsyncOpenAI:
+    """Build the API client with an explicit connection pool.
+
+    The SDK's default pool is smaller than the concurrency this script
+    runs at, so without this the semaphore is not the real bottleneck:
+    requests queue on TCP connection churn instead. HTTP/2 multiplexing
+    is opt-in because it needs the optional h2 package installed.
+    """
+    return AsyncOpenAI(
+        api_key="optillm",
+        base_url="http://localhost:8000/v1",
+        # api_key=os.environ.get("OPENAI_API_KEY"), base_url="https://openrouter.ai/api/v1",
+        # The SDK retries transient failures (rate limits, timeouts,
+        # connection errors) with exponential backoff and honors
+        # Retry-After, so no manual retry loop is needed per request
+        max_retries=3,
+        http_client=httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+            # Generous read timeout: thinking models can take many minutes
+            timeout=httpx.Timeout(1800.0, connect=5.0),
+        ),
+    )
+
+# Initialize OpenAI client; rebuilt from the CLI flags when run as a script
+client = _build_client()
 
 SYSTEM_PROMPT = '''You are solving mathematics problems.
 
@@ -35,16 +57,91 @@ Important: Always end your solution with the final answer in this format:
 
 The entire answer should be contained completely within the \\boxed{} command.'''
 
-def load_math500_dataset() -> list[dict]:
+# Precompiled patterns for the normalization helpers. These run on every
+# answer comparison (recursively for tuples, fractions, and intervals), so
+# compiling them once avoids the per-call pattern-cache lookups.
+_NUM_CLEAN_RE = re.compile(r'[,\$\\]|\s*(?:cm|m|kg|ft|in|lb|oz|ml|L)$|\s*\\text{[^}]+}')
+_TRAILING_TEXT_RE = re.compile(r'\s*\\text{[^}]+}')
+_FRAC_MIXED_BRACE_RE = re.compile(r'^\\frac(\d+)\{(\d+)\}$')
+_FRAC_NO_BRACE_RE = re.compile(r'^\\frac(\d+)(\d+)$')
+_FRAC_STANDARD_RE = re.compile(r'^\\frac\{([^{}]+)\}\{([^{}]+)\}$')
+_MATRIX_FRAC_RE = re.compile(r'^(-)?\\frac\{(\d+)\}\{(\d+)\}$')
+_PMATRIX_RE = re.compile(r'^\\begin\{pmatrix\}(.*?)\\end\{pmatrix\}$')
+_MONOMIAL_RE = re.compile(r'^(-?\d*\.?\d*)?([a-zA-Z])(?:\^(-?\d+))?$')
+_PI_TERM_RE = re.compile(r'^(-?\d*\.?\d*)\\?pi$')
+_FRAC_PI_RE = re.compile(r'^\\frac{([^{}]+)}{([^{}]+)}\\?pi$')
+_FRAC_SIMPLE_RE = re.compile(r'^\\frac{([^{}]+)}{([^{}]+)}$')
+_COMMA_NUM_RE = re.compile(r'^-?[\d,]+$')
+_TERM_RE = re.compile(r'^([+-])?\s*(\d*\.?\d*)?([a-zA-Z](?:\^\d+)?)?$')
+# The trailing alternative keeps dangling operators as their own terms,
+# matching the old char-by-char splitter on malformed input like "5+"
+_TERM_SPLIT_RE = re.compile(r'[+-]?[^+-]+|[+-]')
+
+# Deletes all ASCII whitespace in one C-level pass (vs split()+join)
+_WS_TABLE = str.maketrans('', '', ' \t\n\r\x0b\x0c')
+_INTERVAL_LR_RE = re.compile(r'^\\left?([\[\(])(.*?),(.*?)\\right?([\]\)])$')
+_INTERVAL_RE = re.compile(r'^([\[\(])(.*?),(.*?)([\]\)])$')
+_BACKSLASH_WS_RE = re.compile(r'\\?\s+')
+_TEXT_UNIT_RE = re.compile(r'\\text{[^}]+(?:inches|feet|meters|cm|m|kg|ft|in|lb|oz|ml|L|per|second|minute|hour)[^}]*}')
+_UNESCAPED_WS_RE = re.compile(r'(?<!\\)\s+')
+_ORDERED_PAIR_RE = re.compile(r'^(?:\\left)?\((.*?)(?:\\right)?\)$')
+_PM_RE = re.compile(r'^(.*?)(?:\\pm|-)(.*?)$')
+_TRIG_RE = re.compile(r'^\\(?:sin|cos|tan|cot|sec|csc)\s*([a-zA-Z])$')
+_TRIG_NAME_RE = re.compile(r'^\\(.*?)(?:\s|$)')
+_TEXT_ONLY_RE = re.compile(r'^(?:\\text{)?([A-Za-z]+)(?:})?$')
+# The simple answer shapes (roots, base subscripts, percents, units,
+# currency, plain numbers, multiple choice, degrees) are folded into one
+# alternation so normalize_answer decides the branch in a single scan and
+# dispatches on lastgroup; branch order matches the old match ladder
+_SIMPLE_RE = re.compile(
+    r'(?P<neg_sqrt>-\\sqrt\{?(?P<ns_n>\d+)\}?$)'
+    r'|(?P<sqrt>(?P<sq_c>\d*)?\\sqrt\{?(?P<sq_n>\d+)\}?$)'
+    r'|(?P<sqrt_coeff>(?P<sc_c>\d+)\\sqrt\{?(?P<sc_n>\d+)\}?$)'
+    r'|(?P<base>(?P<b_n>\d+)(?:_\{?(?P<b_1>\d+)\}?|_(?P<b_2>\d+))$)'
+    r'|(?P<percent>(?P<p_n>\d+(?:\.\d*)?)\s*\\?%$)'
+    r'|(?P<unit>(?P<u_n>\d+(?:\.\d*)?)\s*(?:(?:\\[,\s])|,)?\s*(?:\\\\)?(?:\\text{(?:\w+)}|\\?(?:cm|m|kg|ft|in|lb|oz|ml|L))$)'
+    r'|(?P<currency>\\?\$?(?P<c_n>[\d,]+\.?\d*)$)'
+    r'|(?P<comma_num>-?[\d,]+$)'
+    r'|(?P<num_text>(?P<nt_n>-?[\d,]+(?:\.\d*)?)\s*(?:\\(?:mbox|text|hbox|displaystyle)\{[^}]+\})?(?:\^?\d)?$)'
+    r'|(?P<mc>\\text{\(?(?P<mc_a>[A-Za-z])\)?}$|\(?(?P<mc_b>[A-Za-z])\)?$)'
+    r'|(?P<degree>(?P<d_n>-?[\d,]+(?:\.\d*)?)\s*(?:(?:\^?\\circ)|(?:{\\circ})|(?:°))?$)'
+)
+_TEXT_CMD_RE = re.compile(r'\\text{([^{}]+)}')
+_SQRT_NORM_RE = re.compile(r'\\sqrt\{?(\d+)\}?')
+_SQRT_BRACE_RE = re.compile(r'\\sqrt{([^{}]+)}')
+_INT_PERCENT_RE = re.compile(r'^\d+\\%$')
+_INT_FAST_RE = re.compile(r'^-?\d+$')
+_INT_RE = re.compile(r'^\d+$')
+_PERCENT_STRIP_RE = re.compile(r'\\%$')
+
+# Local copy of the problem/answer columns; reading it skips the datasets
+# machinery (hash checks, cache locks, Arrow open) on every run after the first
+_DATASET_CACHE = "cache/math500.jsonl"
+
+def load_math500_dataset() -> Iterable[dict]:
     """
     Load the MATH-500 dataset.
+
+    The first run streams the test split from the Hub — keeping only the
+    two columns the evaluation reads — and writes a local JSONL cache;
+    later runs (and resumes) read the cache directly.
     Returns:
-        list[dict]: The dataset of problems.
+        Iterable[dict]: The dataset of problems.
     """
-    dataset = load_dataset("HuggingFaceH4/MATH-500")
-    dataset = dataset["test"]
-    logging.debug(f"Dataset size: {len(dataset)}.")
-    return dataset
+    if os.path.exists(_DATASET_CACHE):
+        with open(_DATASET_CACHE) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    dataset = load_dataset("HuggingFaceH4/MATH-500", split="test", streaming=True)
+    rows = list(dataset.select_columns(["problem", "answer"]))
+
+    os.makedirs(os.path.dirname(_DATASET_CACHE), exist_ok=True)
+    tmp_path = _DATASET_CACHE + ".tmp"
+    with open(tmp_path, 'w') as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+    os.replace(tmp_path, _DATASET_CACHE)
+    return rows
 
 def extract_answer(response: str) -> Optional[str]:
     """Extract the answer from a math solution response."""
@@ -57,31 +154,40 @@ def extract_answer(response: str) -> Optional[str]:
     if start_idx == -1:
         logger.debug("No \\boxed{} found in response")
         return None
-        
-    # Find the matching closing brace
-    brace_count = 1
-    pos = start_idx + 7  # length of '\boxed{'
-    
-    while pos < len(response) and brace_count > 0:
-        if response[pos] == '{':
-            brace_count += 1
-        elif response[pos] == '}':
-            brace_count -= 1
-        pos += 1
-    
-    if brace_count == 0:
-        answer = response[start_idx + 7:pos - 1]
-        logger.debug(f"Extracted answer: {answer}")
+
+    # Find the matching closing brace with a vectorized depth scan instead
+    # of a per-character Python loop; long chain-of-thought tails make the
+    # interpreted version the hot spot
+    tail = response[start_idx + 7:]  # after '\boxed{'
+    if not tail:
+        logger.debug("No matching closing brace found")
+        return None
+
+    # utf-32 gives one element per code point, so indexes match str slicing
+    codes = np.frombuffer(tail.encode('utf-32-le'), dtype=np.uint32)
+    depth = np.cumsum((codes == ord('{')).astype(np.int32)
+                      - (codes == ord('}')).astype(np.int32)) + 1
+    closed = np.nonzero(depth == 0)[0]
+    if closed.size:
+        answer = tail[:int(closed[0])]
+        logger.debug("Extracted answer: %s", answer)
         return answer.strip()
-    
+
     logger.debug("No matching closing brace found")
     return None
 
+@lru_cache(maxsize=4096)
 def normalize_number(num_str: str) -> str:
     """Helper function to normalize number representation."""
     try:
+        # Fast path: most MATH-500 answers are plain integers, which need
+        # no cleanup at all — just the same float canonicalization ("5"
+        # and "5.0" must keep normalizing to the same string)
+        if _INT_FAST_RE.match(num_str):
+            return str(float(num_str))
+
         # Remove commas, currency symbols, units, and whitespace
-        cleaned = re.sub(r'[,\$\\]|\s*(?:cm|m|kg|ft|in|lb|oz|ml|L)$|\s*\\text{[^}]+}', '', num_str).strip()
+        cleaned = _NUM_CLEAN_RE.sub('', num_str).strip()
         
         # Handle leading decimal point
         if cleaned.startswith('.'):
@@ -99,40 +205,41 @@ def normalize_number(num_str: str) -> str:
         else:
             result = str(num)
         
-        logger.debug(f"Normalized number result: {repr(result)}")
+        logger.debug("Normalized number result: %r", result)
         return result
-    except Exception as e:
-        logger.debug(f"Failed to normalize number: {str(e)}")
+    except (ValueError, AttributeError, TypeError, IndexError) as e:
+        logger.debug("Failed to normalize number: %s", e)
         return num_str
 
 def numerically_equal(str1: str, str2: str) -> bool:
     """Compare if two numeric strings represent the same value."""
     try:
         return abs(float(str1) - float(str2)) < 1e-10
-    except:
+    except (ValueError, TypeError):
         return False
     
+@lru_cache(maxsize=4096)
 def normalize_fraction(fraction_str: str) -> str:
     """Helper function to normalize fractions."""
-    logger.debug(f"Normalizing fraction: {repr(fraction_str)}")
+    logger.debug("Normalizing fraction: %r", fraction_str)
     try:
         # Convert \dfrac to \frac
         fraction_str = fraction_str.replace('\\dfrac', '\\frac')
         
         # Remove all whitespace
-        fraction_str = ''.join(fraction_str.split())
+        fraction_str = fraction_str.translate(_WS_TABLE)
         
         # Remove any trailing text
-        fraction_str = re.sub(r'\s*\\text{[^}]+}', '', fraction_str)
+        fraction_str = _TRAILING_TEXT_RE.sub('', fraction_str)
         
         # Handle mixed brace format first (\frac9{19})
-        mixed_brace = re.match(r'^\\frac(\d+)\{(\d+)\}$', fraction_str)
+        mixed_brace = _FRAC_MIXED_BRACE_RE.match(fraction_str)
         if mixed_brace:
             num, den = mixed_brace.groups()
             return f"\\frac{{{num}}}{{{den}}}"
         
         # Handle no braces format (\frac12)
-        no_braces = re.match(r'^\\frac(\d+)(\d+)$', fraction_str)
+        no_braces = _FRAC_NO_BRACE_RE.match(fraction_str)
         if no_braces:
             num, den = no_braces.groups()
             return f"\\frac{{{num}}}{{{den}}}"
@@ -143,22 +250,22 @@ def normalize_fraction(fraction_str: str) -> str:
             return f"\\frac{{{num.strip()}}}{{{den.strip()}}}"
         
         # Handle standard \frac{a}{b}
-        standard = re.match(r'^\\frac\{([^{}]+)\}\{([^{}]+)\}$', fraction_str)
+        standard = _FRAC_STANDARD_RE.match(fraction_str)
         if standard:
             num, den = standard.groups()
             return f"\\frac{{{num}}}{{{den}}}"
             
-    except Exception as e:
-        logger.debug(f"Failed to normalize fraction: {str(e)}")
-        logger.debug(f"Original fraction string: {repr(fraction_str)}")
+    except (ValueError, AttributeError, TypeError, IndexError) as e:
+        logger.debug("Failed to normalize fraction: %s", e)
+        logger.debug("Original fraction string: %r", fraction_str)
     return fraction_str
 
 def normalize_matrix_entry(entry: str) -> str:
     """Helper function to normalize a single matrix entry."""
-    logger.debug(f"Normalizing matrix entry input: {repr(entry)}")
+    logger.debug("Normalizing matrix entry input: %r", entry)
     
     # Remove all spaces first
-    entry = ''.join(entry.split())
+    entry = entry.translate(_WS_TABLE)
     
     # If it's already in simple a/b format, standardize spacing
     if '/' in entry and not any(c in entry for c in '\\{}'):
@@ -173,7 +280,7 @@ def normalize_matrix_entry(entry: str) -> str:
     entry = entry.replace('\\dfrac', '\\frac')
     
     # Handle LaTeX fractions
-    frac_match = re.match(r'^(-)?\\frac\{(\d+)\}\{(\d+)\}$', entry)
+    frac_match = _MATRIX_FRAC_RE.match(entry)
     if frac_match:
         sign, num, den = frac_match.groups()
         sign = sign if sign else ''
@@ -183,46 +290,44 @@ def normalize_matrix_entry(entry: str) -> str:
 
 def normalize_matrix(matrix_str: str) -> str:
     """Helper function to normalize matrices and vectors."""
-    logger.debug(f"Normalizing matrix input: {repr(matrix_str)}")
+    logger.debug("Normalizing matrix input: %r", matrix_str)
     try:
         # Remove all whitespace
-        matrix_str = ''.join(matrix_str.split())
+        matrix_str = matrix_str.translate(_WS_TABLE)
         
         # Extract the matrix content
-        match = re.match(r'^\\begin\{pmatrix\}(.*?)\\end\{pmatrix\}$', matrix_str)
+        match = _PMATRIX_RE.match(matrix_str)
         if not match:
             return matrix_str
             
         content = match.group(1)
         rows = content.split('\\\\')
         
-        # Normalize each entry in each row
-        normalized_rows = []
-        for row in rows:
-            if '&' in row:
-                entries = [normalize_matrix_entry(entry) for entry in row.split('&')]
-            else:
-                entries = [normalize_matrix_entry(row)]
-            normalized_rows.append('&'.join(entries))
-        
+        # Normalize each entry in each row; split('&') on an &-free row
+        # yields the row itself, so one comprehension covers both vectors
+        # and matrices without the nested Python loop
+        normalized_rows = ['&'.join(normalize_matrix_entry(entry) for entry in row.split('&'))
+                           for row in rows]
+
         # Reconstruct the matrix
         result = "\\begin{pmatrix}" + "\\\\".join(normalized_rows) + "\\end{pmatrix}"
-        logger.debug(f"Normalized matrix result: {repr(result)}")
+        logger.debug("Normalized matrix result: %r", result)
         return result
         
-    except Exception as e:
-        logger.debug(f"Failed to normalize matrix: {str(e)}")
+    except (ValueError, AttributeError, TypeError, IndexError) as e:
+        logger.debug("Failed to normalize matrix: %s", e)
         return matrix_str
 
+@lru_cache(maxsize=4096)
 def normalize_algebraic_expression(expr: str) -> str:
     """Helper function to normalize algebraic expressions."""
-    logger.debug(f"Normalizing algebraic expression: {repr(expr)}")
+    logger.debug("Normalizing algebraic expression: %r", expr)
     try:
         # Remove all whitespace
-        expr = ''.join(expr.split())
+        expr = expr.translate(_WS_TABLE)
         
         # Handle simple monomial with exponent (e.g., 5r^5)
-        monomial_match = re.match(r'^(-?\d*\.?\d*)?([a-zA-Z])(?:\^(-?\d+))?$', expr)
+        monomial_match = _MONOMIAL_RE.match(expr)
         if monomial_match:
             coeff, var, exp = monomial_match.groups()
             coeff = coeff if coeff and coeff not in ['+', '-'] else ('1' if not coeff else '-1')
@@ -239,11 +344,11 @@ def normalize_algebraic_expression(expr: str) -> str:
                 result = f"{coeff}{var}"
             else:
                 result = f"{coeff}{var}^{exp}"
-            logger.debug(f"Matched as monomial with exponent: {repr(result)}")
+            logger.debug("Matched as monomial with exponent: %r", result)
             return result.lower()
             
         # Special case: If it's a single term with π
-        pi_term_match = re.match(r'^(-?\d*\.?\d*)\\?pi$', expr)
+        pi_term_match = _PI_TERM_RE.match(expr)
         if pi_term_match:
             coeff = pi_term_match.group(1)
             if not coeff or coeff == '-':
@@ -251,32 +356,22 @@ def normalize_algebraic_expression(expr: str) -> str:
             return f"{coeff}\\pi"
             
         # Handle fractions with π
-        frac_pi_match = re.match(r'^\\frac{([^{}]+)}{([^{}]+)}\\?pi$', expr)
+        frac_pi_match = _FRAC_PI_RE.match(expr)
         if frac_pi_match:
             num, den = frac_pi_match.groups()
             return f"\\frac{{{num}}}{{{den}}}\\pi"
         
         # Handle basic fractions
-        frac_match = re.match(r'^\\frac{([^{}]+)}{([^{}]+)}$', expr)
+        frac_match = _FRAC_SIMPLE_RE.match(expr)
         if frac_match:
             num, den = frac_match.groups()
             return f"\\frac{{{num}}}{{{den}}}"
         
-        # Split into terms (handle both + and -)
-        terms = []
-        current_term = ""
-        for i, char in enumerate(expr):
-            if char in ['+', '-'] and i > 0:
-                if current_term:
-                    terms.append(current_term)
-                current_term = char
-            else:
-                current_term += char
-        if current_term:
-            terms.append(current_term)
-        
+        # Split into terms (handle both + and -); each term keeps its sign
+        terms = _TERM_SPLIT_RE.findall(expr)
+
         # If it's just a single number, return normalized version
-        if len(terms) == 1 and re.match(r'^-?[\d,]+$', terms[0]):
+        if len(terms) == 1 and _COMMA_NUM_RE.match(terms[0]):
             return normalize_number(terms[0])
             
         # Process each term and sort
@@ -291,7 +386,7 @@ def normalize_algebraic_expression(expr: str) -> str:
                 term = '+' + term
                 
             # Separate coefficient and variable parts
-            match = re.match(r'^([+-])?\s*(\d*\.?\d*)?([a-zA-Z](?:\^\d+)?)?$', term)
+            match = _TERM_RE.match(term)
             if match:
                 sign, coeff, var = match.groups()
                 # Handle default coefficients
@@ -324,15 +419,16 @@ def normalize_algebraic_expression(expr: str) -> str:
                 result += '+'
             result += term
         
-        logger.debug(f"Normalized algebraic expression result: {repr(result)}")
+        logger.debug("Normalized algebraic expression result: %r", result)
         return result.lower()
-    except Exception as e:
-        logger.debug(f"Failed to normalize algebraic expression: {str(e)}")
+    except (ValueError, AttributeError, TypeError, IndexError) as e:
+        logger.debug("Failed to normalize algebraic expression: %s", e)
         return expr.lower()  # Return lowercased original if normalization fails
     
+@lru_cache(maxsize=4096)
 def normalize_interval_bound(bound: str) -> str:
     """Helper function to normalize interval bounds."""
-    logger.debug(f"Normalizing interval bound: {repr(bound)}")
+    logger.debug("Normalizing interval bound: %r", bound)
     
     # Handle infinity
     if '\\infty' in bound:
@@ -344,17 +440,17 @@ def normalize_interval_bound(bound: str) -> str:
 
 def normalize_interval(interval_str: str) -> str:
     """Helper function to normalize intervals."""
-    logger.debug(f"Normalizing interval: {repr(interval_str)}")
+    logger.debug("Normalizing interval: %r", interval_str)
     try:
         # Remove all whitespace first
-        interval_str = ''.join(interval_str.split())
+        interval_str = interval_str.translate(_WS_TABLE)
         
         # Extract the interval content, handling \left and \right
         # Fixed regex to avoid nested set warning by using explicit character classes
-        match = re.match(r'^\\left?([\[\(])(.*?),(.*?)\\right?([\]\)])$', interval_str)
+        match = _INTERVAL_LR_RE.match(interval_str)
         if not match:
             # Try without \left and \right
-            match = re.match(r'^([\[\(])(.*?),(.*?)([\]\)])$', interval_str)
+            match = _INTERVAL_RE.match(interval_str)
             if not match:
                 return interval_str
                 
@@ -366,16 +462,16 @@ def normalize_interval(interval_str: str) -> str:
         
         # Reconstruct the interval
         result = f"\\left{left_bracket}{norm_left},{norm_right}\\right{right_bracket}"
-        logger.debug(f"Normalized interval result: {repr(result)}")
+        logger.debug("Normalized interval result: %r", result)
         return result
         
-    except Exception as e:
-        logger.debug(f"Failed to normalize interval: {str(e)}")
+    except (ValueError, AttributeError, TypeError, IndexError) as e:
+        logger.debug("Failed to normalize interval: %s", e)
         return interval_str
     
 def normalize_ordered_tuple(tuple_str: str) -> str:
     """Helper function to normalize ordered tuples/lists of numbers."""
-    logger.debug(f"Normalizing tuple: {repr(tuple_str)}")
+    logger.debug("Normalizing tuple: %r", tuple_str)
     try:
         # First standardize \dfrac to \frac
         tuple_str = tuple_str.replace('\\dfrac', '\\frac')
@@ -384,7 +480,7 @@ def normalize_ordered_tuple(tuple_str: str) -> str:
         tuple_str = tuple_str.replace('\\left', '').replace('\\right', '')
         
         # Remove all spaces and backslash spaces
-        tuple_str = re.sub(r'\\?\s+', '', tuple_str)
+        tuple_str = _BACKSLASH_WS_RE.sub('', tuple_str)
         
         # Remove outer parentheses and split by commas
         inner = tuple_str.strip('()')
@@ -395,36 +491,90 @@ def normalize_ordered_tuple(tuple_str: str) -> str:
         for part in parts:
             norm_part = normalize_answer(part.strip())
             if not norm_part:  # If any part fails to normalize, return None
-                logger.debug(f"Failed to normalize part: {part}")
+                logger.debug("Failed to normalize part: %s", part)
                 return None
             normalized_parts.append(norm_part)
             
         # Always reconstruct with standard format (using parentheses)
         result = f"({','.join(normalized_parts)})"
-        logger.debug(f"Normalized tuple result: {repr(result)}")
+        logger.debug("Normalized tuple result: %r", result)
         return result
-    except Exception as e:
-        logger.debug(f"Failed to normalize tuple: {str(e)}")
+    except (ValueError, AttributeError, TypeError, IndexError) as e:
+        logger.debug("Failed to normalize tuple: %s", e)
         return None
 
+def _simple_neg_sqrt(m: re.Match) -> str:
+    return f"-\\sqrt{{{m.group('ns_n')}}}"
+
+def _simple_sqrt(m: re.Match) -> str:
+    coeff = m.group('sq_c') or '1'
+    num = m.group('sq_n')
+    if coeff == '1':
+        return f"\\sqrt{{{num}}}"
+    return f"{coeff}\\sqrt{{{num}}}"
+
+def _simple_sqrt_coeff(m: re.Match) -> str:
+    return f"{m.group('sc_c')}\\sqrt{{{m.group('sc_n')}}}"
+
+def _simple_base(m: re.Match) -> str:
+    base = m.group('b_1') or m.group('b_2')
+    return f"{m.group('b_n')}_{base}"
+
+def _simple_percent(m: re.Match) -> str:
+    return normalize_number(m.group('p_n'))
+
+def _simple_unit(m: re.Match) -> str:
+    return normalize_number(m.group('u_n'))
+
+def _simple_currency(m: re.Match) -> str:
+    return normalize_number(m.group('c_n'))
+
+def _simple_comma_num(m: re.Match) -> str:
+    return normalize_number(m.group('comma_num'))
+
+def _simple_num_text(m: re.Match) -> str:
+    return normalize_number(m.group('nt_n'))
+
+def _simple_mc(m: re.Match) -> str:
+    return (m.group('mc_a') or m.group('mc_b')).lower()
+
+def _simple_degree(m: re.Match) -> str:
+    return normalize_number(m.group('d_n'))
+
+# Keyed by the branch names of _SIMPLE_RE; looked up via match.lastgroup
+_SIMPLE_HANDLERS = {
+    'neg_sqrt': _simple_neg_sqrt,
+    'sqrt': _simple_sqrt,
+    'sqrt_coeff': _simple_sqrt_coeff,
+    'base': _simple_base,
+    'percent': _simple_percent,
+    'unit': _simple_unit,
+    'currency': _simple_currency,
+    'comma_num': _simple_comma_num,
+    'num_text': _simple_num_text,
+    'mc': _simple_mc,
+    'degree': _simple_degree,
+}
+
+@lru_cache(maxsize=4096)
 def normalize_answer(answer: str) -> str:
     """Normalize the answer string for comparison."""
-    logger.debug(f"Normalizing answer: {repr(answer)}")
+    logger.debug("Normalizing answer: %r", answer)
     
     if answer is None:
         logger.debug("Received None answer")
         return ""
     
     # Remove \text{} with units first
-    answer = re.sub(r'\\text{[^}]+(?:inches|feet|meters|cm|m|kg|ft|in|lb|oz|ml|L|per|second|minute|hour)[^}]*}', '', answer)
+    answer = _TEXT_UNIT_RE.sub('', answer)
     
 
     # Remove all whitespace first but preserve backslash space temporarily
-    answer = re.sub(r'(?<!\\)\s+', '', answer)
-    logger.debug(f"After initial whitespace removal: {repr(answer)}")
+    answer = _UNESCAPED_WS_RE.sub('', answer)
+    logger.debug("After initial whitespace removal: %r", answer)
     
     # Then handle ordered pairs/tuples with potential \left, \right
-    ordered_pair_match = re.match(r'^(?:\\left)?\((.*?)(?:\\right)?\)$', answer)
+    ordered_pair_match = _ORDERED_PAIR_RE.match(answer)
     if ordered_pair_match:
         content = ordered_pair_match.group(1)
         # Split by comma and normalize each part
@@ -432,7 +582,7 @@ def normalize_answer(answer: str) -> str:
         normalized_parts = []
         for part in parts:
             # Remove any remaining backslash spaces
-            part = re.sub(r'\\?\s+', '', part)
+            part = _BACKSLASH_WS_RE.sub('', part)
             norm_part = normalize_answer(part)
             if norm_part is None:
                 return None
@@ -440,8 +590,8 @@ def normalize_answer(answer: str) -> str:
         return f"({','.join(normalized_parts)})"
     
     # Remove all whitespace
-    answer = ''.join(answer.split())
-    logger.debug(f"After whitespace removal: {repr(answer)}")
+    answer = answer.translate(_WS_TABLE)
+    logger.debug("After whitespace removal: %r", answer)
     
     if not answer:
         logger.debug("Answer became empty after whitespace removal")
@@ -449,7 +599,7 @@ def normalize_answer(answer: str) -> str:
     
     # Handle plus-minus expressions first
     # This will match both forms: "a \pm b" and "a - b"
-    pm_match = re.match(r'^(.*?)(?:\\pm|-)(.*?)$', answer)
+    pm_match = _PM_RE.match(answer)
     if pm_match:
         left, right = pm_match.groups()
         # Normalize both sides
@@ -458,24 +608,24 @@ def normalize_answer(answer: str) -> str:
         if norm_left or norm_right:  # If either side normalized successfully
             # Always use \pm in the normalized form
             result = f"{norm_left}\\pm{norm_right}"
-            logger.debug(f"Matched as plus-minus expression: {repr(result)}")
+            logger.debug("Matched as plus-minus expression: %r", result)
             return result
     
     # Handle trigonometric functions
-    trig_match = re.match(r'^\\(?:sin|cos|tan|cot|sec|csc)\s*([a-zA-Z])$', answer)
+    trig_match = _TRIG_RE.match(answer)
     if trig_match:
         variable = trig_match.group(1)
         # Get the function name without the backslash
-        func_name = re.match(r'^\\(.*?)(?:\s|$)', answer).group(1)
+        func_name = _TRIG_NAME_RE.match(answer).group(1)
         result = f"\\{func_name}{variable}"
-        logger.debug(f"Matched as trigonometric function: {repr(result)}")
+        logger.debug("Matched as trigonometric function: %r", result)
         return result
 
     # Handle text-only answers first (including multiple choice)
-    text_match = re.match(r'^(?:\\text{)?([A-Za-z]+)(?:})?$', answer)
+    text_match = _TEXT_ONLY_RE.match(answer)
     if text_match:
         result = text_match.group(1).lower()
-        logger.debug(f"Matched as text answer: {repr(result)}")
+        logger.debug("Matched as text answer: %r", result)
         return result
 
     # Handle intervals first (with or without \left and \right)
@@ -485,14 +635,14 @@ def normalize_answer(answer: str) -> str:
         answer.endswith(']') or answer.endswith(')')):
         result = normalize_interval(answer)
         if result:
-            logger.debug(f"Matched as interval: {repr(result)}")
+            logger.debug("Matched as interval: %r", result)
             return result
     
     # Handle matrices/vectors
     if answer.startswith('\\begin{pmatrix}') and answer.endswith('\\end{pmatrix}'):
         result = normalize_matrix(answer)
         if result:
-            logger.debug(f"Matched as matrix: {repr(result)}")
+            logger.debug("Matched as matrix: %r", result)
             return result
     
     # Normalize all fraction commands to \frac first
@@ -502,107 +652,28 @@ def normalize_answer(answer: str) -> str:
     if '\\frac' in answer or '\\dfrac' in answer or '/' in answer:
         result = normalize_fraction(answer)
         if result:
-            logger.debug(f"Matched as fraction: {repr(result)}")
+            logger.debug("Matched as fraction: %r", result)
             return result
 
-    # Handle negative square roots first (before other square root handling)
-    neg_sqrt_match = re.match(r'^-\\sqrt\{?(\d+)\}?$', answer)
-    if neg_sqrt_match:
-        num = neg_sqrt_match.group(1)
-        result = f"-\\sqrt{{{num}}}"
-        logger.debug(f"Matched as negative square root: {repr(result)}")
-        return result
-
-    # Handle direct square root expressions first
-    logger.debug("Checking for square root pattern...")
-    sqrt_match = re.match(r'^(\d*)?\\sqrt\{?(\d+)\}?$', answer)
-    if sqrt_match:
-        coeff, num = sqrt_match.groups()
-        coeff = coeff if coeff else '1'
-        if coeff == '1':
-            result = f"\\sqrt{{{num}}}"
-        else:
-            result = f"{coeff}\\sqrt{{{num}}}"
-        logger.debug(f"Matched as pure square root: {repr(result)}")
-        return result
-
-    # Now handle coefficient with square root
-    sqrt_with_coeff_match = re.match(r'^(\d+)\\sqrt\{?(\d+)\}?$', answer)
-    if sqrt_with_coeff_match:
-        coeff, num = sqrt_with_coeff_match.groups()
-        result = f"{coeff}\\sqrt{{{num}}}"
-        logger.debug(f"Matched as coefficient with square root: {repr(result)}")
-        return result
-    
-    # Handle numbers with base subscripts
-    base_match = re.match(r'^(\d+)(?:_\{?(\d+)\}?|_(\d+))$', answer)
-    if base_match:
-        number, base1, base2 = base_match.groups()
-        base = base1 if base1 else base2
-        result = f"{number}_{base}"
-        logger.debug(f"Matched as base number: {repr(result)}")
+    # Handle the simple shapes (roots, bases, percents, units, currency,
+    # plain numbers, multiple choice, degrees) with one alternation scan
+    # and dispatch on the branch that matched
+    simple_match = _SIMPLE_RE.match(answer)
+    if simple_match:
+        result = _SIMPLE_HANDLERS[simple_match.lastgroup](simple_match)
+        logger.debug("Matched as %s: %r", simple_match.lastgroup, result)
         return result
 
-    # Handle numbers with percentage sign first
-    percent_match = re.match(r'^(\d+(?:\.\d*)?)\s*\\?%$', answer)
-    if percent_match:
-        number = percent_match.group(1)
-        result = normalize_number(number)
-        logger.debug(f"Matched as percentage: {repr(result)}")
-        return result
-    
-    # Handle numbers with units (including LaTeX spaces and comma-separated units)
-    unit_match = re.match(r'^(\d+(?:\.\d*)?)\s*(?:(?:\\[,\s])|,)?\s*(?:\\\\)?(?:\\text{(\w+)}|\\?(?:cm|m|kg|ft|in|lb|oz|ml|L))$', answer)
-    if unit_match:
-        number = unit_match.group(1)
-        result = normalize_number(number)
-        logger.debug(f"Matched as number with unit: {repr(result)}")
-        return result
-    
-    # Try to handle currency values first
-    currency_match = re.match(r'^\\?\$?([\d,]+\.?\d*)$', answer)
-    if currency_match:
-        result = normalize_number(currency_match.group(1))
-        logger.debug(f"Matched as currency: {repr(result)}")
-        return result
-    
-    # Try to handle pure numbers with commas first
-    if re.match(r'^-?[\d,]+$', answer):
-        result = normalize_number(answer)
-        logger.debug(f"Matched as number: {repr(result)}")
-        return result
-    
-    # Try to extract numeric value with optional units
-    unit_match = re.match(r'^(-?[\d,]+(?:\.\d*)?)\s*(?:\\(?:mbox|text|hbox|displaystyle)\{[^}]+\})?(?:\^?\d)?$', answer)
-    if unit_match:
-        result = normalize_number(unit_match.group(1))
-        logger.debug(f"Matched as number with units: {repr(result)}")
-        return result
-    
-    # Handle multiple choice answers
-    mc_match = re.match(r'^\\text{\(?([A-Za-z])\)?}$|^\(?([A-Za-z])\)?$', answer)
-    if mc_match:
-        result = (mc_match.group(1) or mc_match.group(2)).lower()
-        logger.debug(f"Matched as multiple choice: {repr(result)}")
-        return result
-    
-    # Handle degrees
-    degree_match = re.match(r'^(-?[\d,]+(?:\.\d*)?)\s*(?:(?:\^?\\circ)|(?:{\\circ})|(?:°))?$', answer)
-    if degree_match:
-        result = normalize_number(degree_match.group(1))
-        logger.debug(f"Matched as degrees: {repr(result)}")
-        return result
-    
     # Remove \text{} command without changing content FIRST
-    answer = re.sub(r'\\text{([^{}]+)}', r'\1', answer)
-    logger.debug(f"After \\text removal: {repr(answer)}")
+    answer = _TEXT_CMD_RE.sub(r'\1', answer)
+    logger.debug("After \\text removal: %r", answer)
     
     # Try to handle algebraic expressions
     try:
         result = normalize_algebraic_expression(answer)
-        logger.debug(f"Normalized as algebraic expression: {repr(result)}")
+        logger.debug("Normalized as algebraic expression: %r", result)
         return result
-    except:
+    except (ValueError, TypeError):
         logger.debug("Failed to normalize as algebraic expression")
         pass
     
@@ -616,15 +687,15 @@ def normalize_answer(answer: str) -> str:
     answer = answer.replace('\\{', '{').replace('\\}', '}')
     
     # Normalize square roots consistently
-    answer = re.sub(r'\\sqrt\{?(\d+)\}?', r'\\sqrt{\1}', answer)
-    answer = re.sub(r'\\sqrt{([^{}]+)}', r'\\sqrt\1', answer)
+    answer = _SQRT_NORM_RE.sub(r'\\sqrt{\1}', answer)
+    answer = _SQRT_BRACE_RE.sub(r'\\sqrt\1', answer)
     
     # Handle percentage notation
-    if re.match(r'^\d+\\%$', answer) or re.match(r'^\d+$', answer):
-        answer = re.sub(r'\\%$', '', answer)
+    if _INT_PERCENT_RE.match(answer) or _INT_RE.match(answer):
+        answer = _PERCENT_STRIP_RE.sub('', answer)
     
     # Handle \text{} command again in case it was nested
-    answer = re.sub(r'\\text{([^{}]+)}', r'\1', answer)
+    answer = _TEXT_CMD_RE.sub(r'\1', answer)
     
     # Strip unnecessary outer braces
     while len(answer) >= 2 and answer[0] == '{' and answer[-1] == '}':
@@ -633,25 +704,35 @@ def normalize_answer(answer: str) -> str:
         answer = answer[1:-1]
     
     result = answer.lower()
-    logger.debug(f"Final normalized result: {repr(result)}")
+    logger.debug("Final normalized result: %r", result)
     return result if result else None
 
 def compare_answers(correct_answer: str, predicted_answer: Optional[str]) -> bool:
     """Compare the correct answer with the predicted answer."""
-    logger.debug(f"Comparing answers - Correct: {repr(correct_answer)}, Predicted: {repr(predicted_answer)}")
-    
+    return compare_answers_prenorm(correct_answer, normalize_answer(correct_answer), predicted_answer)
+
+def compare_answers_prenorm(correct_answer: str, normalized_correct: Optional[str],
+                            predicted_answer: Optional[str]) -> bool:
+    """Compare against a ground truth whose normalization was done up front."""
+    logger.debug("Comparing answers - Correct: %r, Predicted: %r", correct_answer, predicted_answer)
+
     if predicted_answer is None:
         logger.debug("Predicted answer is None")
         return False
-    
+
+    # Identical strings (modulo surrounding whitespace) need no
+    # normalization at all; most correct predictions hit this path
+    if correct_answer.strip() == predicted_answer.strip():
+        logger.debug("Exact match after strip")
+        return True
+
     # Try numerical comparison first
     if numerically_equal(correct_answer, predicted_answer):
         return True
-        
-    normalized_correct = normalize_answer(correct_answer)
+
     normalized_predicted = normalize_answer(predicted_answer)
-    
-    logger.debug(f"Normalized answers - Correct: {repr(normalized_correct)}, Predicted: {repr(normalized_predicted)}")
+
+    logger.debug("Normalized answers - Correct: %r, Predicted: %r", normalized_correct, normalized_predicted)
     
     # If either normalization returns None or empty string, answers don't match
     if not normalized_correct or not normalized_predicted:
@@ -667,26 +748,28 @@ def compare_answers(correct_answer: str, predicted_answer: Optional[str]) -> boo
     if ('\\left[' in normalized_correct or '\\left(' in normalized_correct) and \
        ('\\left[' in normalized_predicted or '\\left(' in normalized_predicted):
         result = normalized_correct == normalized_predicted
-        logger.debug(f"Interval comparison result: {result}")
+        logger.debug("Interval comparison result: %s", result)
         return result
     
     result = normalized_correct == normalized_predicted
-    logger.debug(f"Comparison result: {result}")
+    logger.debug("Comparison result: %s", result)
     return result
 
-def get_llm_response(problem: str, model: str) -> str:
+async def get_llm_response(problem: str, model: str) -> str:
     """
     Get response from the LLM for a given problem.
-    
+
     Args:
         problem (str): The problem text
         model (str): The model identifier
-        
+
     Returns:
         str: Model's response
     """
     try:
-        response = client.chat.completions.create(
+        # Transient errors are retried by the client (max_retries with
+        # exponential backoff); only exhausted failures land here
+        response = await client.chat.completions.create(
             model=model,
             temperature=0.6,  # Lower temperature for more consistent answers
             messages=[
@@ -698,27 +781,30 @@ def get_llm_response(problem: str, model: str) -> str:
             # }
         )
         return response.choices[0].message.content.strip()
-        
+
     except Exception as e:
-        logger.error(f"Error getting LLM response: {e}")
+        logger.error("Error getting LLM response: %s", e)
         return ""
 
 def load_existing_results(filename: str) -> list[Dict]:
-    """Load existing results from file if it exists."""
+    """Load existing results by streaming the JSONL file if it exists."""
+    results = []
     try:
         with open(filename, 'r') as f:
-            return json.load(f)
+            for line in f:
+                line = line.strip()
+                if line:
+                    results.append(json.loads(line))
     except FileNotFoundError:
-        return []
+        pass
+    return results
 
-def save_result(filename: str, result: Dict):
-    """Save a single result to the results file."""
-    results = load_existing_results(filename)
-    results.append(result)
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+def save_result(results_fh: TextIO, result: Dict) -> None:
+    """Append a single result to the open results file."""
+    results_fh.write(json.dumps(result) + "\n")
+    results_fh.flush()
 
-def analyze_results(results: list[Dict]):
+def analyze_results(results: list[Dict]) -> None:
     """
     Analyze and print summary statistics of the results.
     
@@ -742,48 +828,217 @@ def analyze_results(results: list[Dict]):
             print(f"Predicted: {r['predicted_answer']}")
             print("---")
 
-def main(model: str):
+async def evaluate_problem(idx: int, item: Dict, model: str, semaphore: asyncio.Semaphore,
+                           normalized_correct: Optional[str]) -> Dict:
+    """Evaluate a single problem, bounded by the shared semaphore."""
+    problem_text = item['problem']
+    correct_answer = item['answer']
+
+    # Get model's response
+    async with semaphore:
+        response = await get_llm_response(problem_text, model)
+    predicted_answer = extract_answer(response)
+
+    # Compare against the pre-normalized ground truth
+    is_correct = compare_answers_prenorm(correct_answer, normalized_correct, predicted_answer)
+
+    return {
+        "index": idx,
+        "problem": problem_text,
+        "response": response,
+        "correct_answer": correct_answer,
+        "predicted_answer": predicted_answer,
+        "is_correct": is_correct
+    }
+
+async def run_evaluation(dataset: Iterable[dict], model: str, results_file: str,
+                         processed_indexes: bytearray, concurrency: int) -> None:
+    """Schedule the unprocessed problems concurrently and save results as they finish."""
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = [(idx, item) for idx, item in enumerate(dataset)
+               if idx >= len(processed_indexes) or not processed_indexes[idx]]
+
+    # The ground-truth answers are fixed, so normalize each of them once
+    # up front instead of on every comparison. For MATH-500-sized runs
+    # this is done in-process; a full MATH sweep (12.5k rows) is worth
+    # fanning out across cores before the first LLM call goes out
+    answers = [item['answer'] for _, item in pending]
+    if len(answers) >= _POOL_NORMALIZE_MIN:
+        with Pool(os.cpu_count()) as pool:
+            normalized = list(pool.imap(normalize_answer, answers, chunksize=64))
+    else:
+        normalized = [normalize_answer(answer) for answer in answers]
+
+    tasks = [evaluate_problem(idx, item, model, semaphore, normalized_correct)
+             for (idx, item), normalized_correct in zip(pending, normalized)]
+
+    # Appending one line per result keeps saving O(1) per problem instead
+    # of rewriting the whole file; writes happen only in this loop, so no
+    # extra locking is needed
+    with open(results_file, 'a') as results_fh:
+        for future in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Evaluating problems"):
+            result = await future
+            save_result(results_fh, result)
+
+def _cmp_pair(pair: tuple) -> bool:
+    """Compare one (correct, predicted) pair; module-level so pool workers can pickle it."""
+    correct, predicted = pair
+    return compare_answers(correct, predicted)
+
+def recheck_results(results_file: str) -> None:
+    """Re-score an existing results file with the current normalization.
+
+    Useful after changes to the normalize helpers: no LLM calls are made.
+    The comparisons are pure CPU-bound Python, so they are fanned out
+    across a process pool; chunking amortizes the IPC per pair.
+    """
+    results = load_existing_results(results_file)
+    if not results:
+        logger.info("No results to recheck in %s", results_file)
+        return
+
+    pairs = [(r['correct_answer'], r['predicted_answer']) for r in results]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        flags = list(executor.map(_cmp_pair, pairs, chunksize=32))
+
+    changed = sum(1 for r, flag in zip(results, flags) if r['is_correct'] != flag)
+    for r, flag in zip(results, flags):
+        r['is_correct'] = flag
+    with open(results_file, 'w') as results_fh:
+        for r in results:
+            save_result(results_fh, r)
+    logger.info("Rechecked %d results (%d changed)", len(results), changed)
+    analyze_results(results)
+
+_BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Below this many ground-truth answers, pool startup costs more than the
+# normalization itself
+_POOL_NORMALIZE_MIN = 2000
+
+async def run_batch_evaluation(dataset: Iterable[dict], model: str, results_file: str,
+                               processed_indexes: bytearray) -> None:
+    """Run the remaining problems through the OpenAI Batch API.
+
+    One upload covers the whole sweep: slower to come back (up to the 24h
+    completion window) but cheaper per token and not subject to per-minute
+    rate limits. Only unprocessed indexes are submitted, so interrupted
+    runs resume the same way as the concurrent path.
+    """
+    pending = [(idx, item) for idx, item in enumerate(dataset)
+               if idx >= len(processed_indexes) or not processed_indexes[idx]]
+    if not pending:
+        logger.info("No unprocessed problems left")
+        return
+
+    lines = [json.dumps({
+        "custom_id": str(idx),
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": model,
+            "temperature": 0.6,
+            "messages": [
+                {"role": "user", "content": SYSTEM_PROMPT + "\n" + item['problem']}
+            ],
+            "max_tokens": 8192,
+        },
+    }) for idx, item in pending]
+    input_file = await client.files.create(
+        file=("math500_batch_input.jsonl", ("\n".join(lines) + "\n").encode()),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("Submitted batch %s with %d problems", batch.id, len(pending))
+
+    # Poll with exponential backoff; batches typically take minutes to hours
+    delay = 10.0
+    while batch.status not in _BATCH_TERMINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 600.0)
+        batch = await client.batches.retrieve(batch.id)
+        logger.info("Batch %s status: %s", batch.id, batch.status)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} finished with status {batch.status!r}")
+
+    by_idx = dict(pending)
+    output = await client.files.content(batch.output_file_id)
+    with open(results_file, 'a') as results_fh:
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            idx = int(entry["custom_id"])
+            item = by_idx[idx]
+            body = (entry.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            response_text = (choices[0]["message"]["content"] or "").strip() if choices else ""
+            predicted_answer = extract_answer(response_text)
+            save_result(results_fh, {
+                "index": idx,
+                "problem": item['problem'],
+                "response": response_text,
+                "correct_answer": item['answer'],
+                "predicted_answer": predicted_answer,
+                "is_correct": compare_answers(item['answer'], predicted_answer)
+            })
+
+def main(model: str, concurrency: int, mode: str) -> None:
     """Main evaluation function."""
     os.makedirs("results", exist_ok=True)
-    results_file = f"evaluation_results_math500_{model.replace('/', '_')}.json"
-    
+    results_file = f"evaluation_results_math500_{model.replace('/', '_')}.jsonl"
+
     dataset = load_math500_dataset()
     existing_results = load_existing_results(results_file)
-    
-    # Create a set of already processed indexes for efficient lookup
-    processed_indexes = {result['index'] for result in existing_results}
-    
-    for idx, item in enumerate(tqdm(dataset, desc="Evaluating problems")):
-        # Skip if this index has already been processed
-        if idx in processed_indexes:
-            continue
-            
-        problem_text = item['problem']
-        correct_answer = item['answer']
-        
-        # Get model's response
-        response = get_llm_response(problem_text, model)
-        predicted_answer = extract_answer(response)
 
-        # Compare answers using the new comparison function
-        is_correct = compare_answers(correct_answer, predicted_answer)
-        
-        result = {
-            "index": idx,
-            "problem": problem_text,
-            "response": response,
-            "correct_answer": correct_answer,
-            "predicted_answer": predicted_answer,
-            "is_correct": is_correct
-        }
-        save_result(results_file, result)
-    
+    # Dense bitset of already processed indexes: byte i is 1 if problem i
+    # is done, so the per-problem check is a plain index with no hashing
+    size = max((result['index'] for result in existing_results), default=-1) + 1
+    processed_indexes = bytearray(size)
+    for result in existing_results:
+        processed_indexes[result['index']] = 1
+
+    if mode == "batch":
+        asyncio.run(run_batch_evaluation(dataset, model, results_file, processed_indexes))
+    else:
+        # Overlap the LLM calls: wall time is dominated by serialized network
+        # latency, so issuing up to `concurrency` requests at once gives a
+        # near-linear speedup until the proxy saturates
+        asyncio.run(run_evaluation(dataset, model, results_file, processed_indexes, concurrency))
+
     final_results = load_existing_results(results_file)
     analyze_results(final_results)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Evaluate LLM performance on MATH-500 problems")
     parser.add_argument("--model", type=str, required=True, help="OpenAI model to use (e.g., gpt-4, gpt-3.5-turbo)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum number of in-flight LLM requests")
+    parser.add_argument("--mode", choices=("async", "batch"), default="async",
+                        help="async: concurrent per-request calls; batch: one OpenAI Batch API job")
+    parser.add_argument("--max-connections", type=int, default=64,
+                        help="Size of the HTTP connection pool shared by all requests")
+    parser.add_argument("--http2", action=argparse.BooleanOptionalAction, default=False,
+                        help="Multiplex requests over HTTP/2 (requires the h2 package)")
+    parser.add_argument("--recheck", action="store_true",
+                        help="Re-score the existing results file with the current normalization (no LLM calls)")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging of the answer normalization")
     args = parser.parse_args()
-    
-    main(args.model)
+
+    # The normalization helpers emit per-call debug records; at INFO those
+    # records (and their lazy %-formatted arguments) are skipped entirely
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    client = _build_client(args.max_connections, args.http2)
+
+    if args.recheck:
+        recheck_results(f"evaluation_results_math500_{args.model.replace('/', '_')}.jsonl")
+    else:
+        main(args.model, args.concurrency, args.mode)
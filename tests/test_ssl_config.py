@@ -92,6 +92,10 @@ class TestHTTPClientSSLConfiguration(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.original_config = server_config.copy()
+        # Clients are cached per configuration fingerprint; reset so each
+        # test observes a fresh client construction.
+        from optillm.server import _client_cache
+        _client_cache.clear()
 
     def tearDown(self):
         """Restore original server_config."""
@@ -314,6 +318,10 @@ class TestSSLWarnings(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.original_config = server_config.copy()
+        # Clients are cached per configuration fingerprint; reset so each
+        # test observes a fresh client construction.
+        from optillm.server import _client_cache
+        _client_cache.clear()
 
     def tearDown(self):
         """Restore original server_config."""